@@ -0,0 +1,28 @@
+"""Add announcements keyset pagination index
+
+Revision ID: 3f2b7c9d1e04
+Revises: 81978362973d
+Create Date: 2026-10-18 09:12:40.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f2b7c9d1e04'
+down_revision: Union[str, Sequence[str], None] = '81978362973d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_announcements_created_at_guid', 'announcements', ['created_at', 'guid'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_announcements_created_at_guid', table_name='announcements')
@@ -0,0 +1,48 @@
+"""Add user_feed table for fan-out-on-write sector feeds
+
+Revision ID: a4c81e5f2d97
+Revises: f3a9d6b1c852
+Create Date: 2026-10-18 19:12:54.630871
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4c81e5f2d97'
+down_revision: Union[str, Sequence[str], None] = 'f3a9d6b1c852'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Tablo boş oluşturulur; mevcut veri uygulama açılışındaki feed eşitlemesiyle
+    # (feed.py) parça parça doldurulur, migration büyük tabloları kilitlemez.
+    op.create_table(
+        'user_feed',
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('announcement_guid', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['announcement_guid'], ['announcements.guid'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id', 'announcement_guid')
+    )
+    op.create_index(
+        'ix_user_feed_user_created_at',
+        'user_feed',
+        ['user_id', 'created_at', 'announcement_guid'],
+        unique=False
+    )
+    op.create_index('ix_user_feed_announcement_guid', 'user_feed', ['announcement_guid'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_user_feed_announcement_guid', table_name='user_feed')
+    op.drop_index('ix_user_feed_user_created_at', table_name='user_feed')
+    op.drop_table('user_feed')
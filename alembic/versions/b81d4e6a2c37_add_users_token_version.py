@@ -0,0 +1,28 @@
+"""Add users.token_version
+
+Revision ID: b81d4e6a2c37
+Revises: 3f2b7c9d1e04
+Create Date: 2026-10-18 11:03:52.447190
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b81d4e6a2c37'
+down_revision: Union[str, Sequence[str], None] = '3f2b7c9d1e04'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('users', sa.Column('token_version', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('users', 'token_version')
@@ -0,0 +1,35 @@
+"""Add saved_announcements.saved_at
+
+Revision ID: c5e93a1f7b20
+Revises: b81d4e6a2c37
+Create Date: 2026-10-18 12:41:07.903315
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5e93a1f7b20'
+down_revision: Union[str, Sequence[str], None] = 'b81d4e6a2c37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('saved_announcements', sa.Column('saved_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False))
+    op.create_index(
+        'ix_saved_announcements_user_saved_at',
+        'saved_announcements',
+        ['user_id', 'saved_at', 'announcement_guid'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_saved_announcements_user_saved_at', table_name='saved_announcements')
+    op.drop_column('saved_announcements', 'saved_at')
@@ -0,0 +1,39 @@
+"""Add GIN indexes on announcements.sectors and users.sectors
+
+Revision ID: d0a4f27c8e51
+Revises: c5e93a1f7b20
+Create Date: 2026-10-18 13:26:44.581930
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd0a4f27c8e51'
+down_revision: Union[str, Sequence[str], None] = 'c5e93a1f7b20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY bir transaction içinde çalışamaz; tabloyu kilitlemeden oluşturulur
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_announcements_sectors_gin', 'announcements', ['sectors'],
+            unique=False, postgresql_using='gin', postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_users_sectors_gin', 'users', ['sectors'],
+            unique=False, postgresql_using='gin', postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_users_sectors_gin', table_name='users', postgresql_concurrently=True)
+        op.drop_index('ix_announcements_sectors_gin', table_name='announcements', postgresql_concurrently=True)
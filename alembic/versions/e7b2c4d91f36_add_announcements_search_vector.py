@@ -0,0 +1,48 @@
+"""Add generated search_vector column and GIN index on announcements
+
+Revision ID: e7b2c4d91f36
+Revises: d0a4f27c8e51
+Create Date: 2026-10-18 15:02:11.204518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7b2c4d91f36'
+down_revision: Union[str, Sequence[str], None] = 'd0a4f27c8e51'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('announcements', sa.Column(
+        'search_vector',
+        postgresql.TSVECTOR(),
+        sa.Computed(
+            "setweight(to_tsvector('turkish', coalesce(title, '')), 'A') || "
+            "setweight(to_tsvector('turkish', coalesce(description, '')), 'B')",
+            persisted=True
+        ),
+        nullable=True
+    ))
+    # CONCURRENTLY bir transaction içinde çalışamaz; tabloyu kilitlemeden oluşturulur
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_announcements_search_vector_gin', 'announcements', ['search_vector'],
+            unique=False, postgresql_using='gin', postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_announcements_search_vector_gin', table_name='announcements', postgresql_concurrently=True
+        )
+    op.drop_column('announcements', 'search_vector')
@@ -0,0 +1,47 @@
+"""Backfill announcements.is_active and add partial indexes on it
+
+Revision ID: f3a9d6b1c852
+Revises: e7b2c4d91f36
+Create Date: 2026-10-18 17:41:37.518204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a9d6b1c852'
+down_revision: Union[str, Sequence[str], None] = 'e7b2c4d91f36'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PARTIAL_INDEXES = [
+    ('ix_announcements_active_created_at', ['created_at', 'guid'], 'is_active'),
+    ('ix_announcements_passive_created_at', ['created_at', 'guid'], 'NOT is_active'),
+    ('ix_announcements_active_deadline', ['application_deadline'], 'is_active'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Şimdiye kadar hiç güncellenmeyen is_active, son başvuru tarihinden türetilir
+    op.execute(
+        "UPDATE announcements SET is_active = (application_deadline > now()) "
+        "WHERE is_active IS DISTINCT FROM (application_deadline > now())"
+    )
+    # CONCURRENTLY bir transaction içinde çalışamaz; tabloyu kilitlemeden oluşturulur
+    with op.get_context().autocommit_block():
+        for name, columns, predicate in PARTIAL_INDEXES:
+            op.create_index(
+                name, 'announcements', columns, unique=False,
+                postgresql_where=sa.text(predicate), postgresql_concurrently=True
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, _, _ in PARTIAL_INDEXES:
+            op.drop_index(name, table_name='announcements', postgresql_concurrently=True)
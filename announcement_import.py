@@ -0,0 +1,214 @@
+import csv
+import json
+import uuid
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple
+
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy import insert
+from starlette.requests import ClientDisconnect
+
+from database import AsyncSessionLocal
+from expiry_scheduler import is_open
+from feed import fan_out
+from middlewares.pipeline import RequestBodyTooLarge
+from models.announcement_model import AnnouncementModel
+from schemas import AnnouncementCreateRequest, AnnouncementImportError, AnnouncementImportResult
+
+# -------------------------------
+# 📥 Toplu duyuru içe aktarımı
+# -------------------------------
+# Gövde akış halinde okunur; satırlar IMPORT_BATCH_SIZE'lık partiler halinde
+# doğrulanır ve her parti kendi transaction'ında COPY ile yazılır. Bir partinin
+# yazımı başarısız olursa yalnızca o partinin satırları hatalı sayılır. Gövde
+# yarıda kesilirse (boyut sınırı, bağlantı kopması) commit edilmiş partiler
+# kalır; rapor o ana kadarki sonucu ve kesilme nedenini döner.
+
+IMPORT_BATCH_SIZE = 2000
+MAX_REPORTED_ERRORS = 1000
+
+# CSV'de liste alanları dışa aktarımdaki gibi "|" ile ayrılır
+LIST_FIELDS = {"eligible_institution", "sectors"}
+IMPORT_COLUMNS = ["guid", *AnnouncementCreateRequest.model_fields, "is_active"]
+
+announcement_batch_adapter = TypeAdapter(List[AnnouncementCreateRequest])
+
+
+async def _lines(stream: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    pending = b""
+    first = True
+    async for chunk in stream:
+        pending += chunk
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            yield line.decode("utf-8-sig" if first else "utf-8").rstrip("\r")
+            first = False
+    if pending:
+        yield pending.decode("utf-8-sig" if first else "utf-8").rstrip("\r")
+
+
+async def _csv_records(stream: AsyncIterator[bytes]) -> AsyncIterator[Tuple[int, Any]]:
+    """
+    Tırnak içindeki satır sonları bir kaydı birden çok fiziksel satıra
+    böldüğünden, tırnak sayısı çift olana kadar satırlar birleştirilir.
+    """
+    header = None
+    record, row = "", 0
+    async for line in _lines(stream):
+        record = f"{record}\n{line}" if record else line
+        if record.count('"') % 2:
+            continue
+        values, record = next(csv.reader([record]), []), ""
+        if not values:
+            continue
+        if header is None:
+            header = values
+            continue
+        row += 1
+        data: Dict[str, Any] = dict(zip(header, values))
+        for field in LIST_FIELDS & data.keys():
+            data[field] = [part for part in data[field].split("|") if part]
+        yield row, data
+
+
+async def _ndjson_records(stream: AsyncIterator[bytes]) -> AsyncIterator[Tuple[int, Any]]:
+    row = 0
+    async for line in _lines(stream):
+        if not line.strip():
+            continue
+        row += 1
+        try:
+            yield row, json.loads(line)
+        except ValueError:
+            yield row, None
+
+
+def _abort_reason(exc: Exception) -> str:
+    if isinstance(exc, RequestBodyTooLarge):
+        return exc.detail
+    if isinstance(exc, ClientDisconnect):
+        return "İstemci bağlantısı koptu."
+    return "Gövde geçerli UTF-8 değil."
+
+
+def _clean_message(err: dict) -> str:
+    msg = err.get("msg", "")
+    if "Value error" in msg:
+        msg = msg.split(", ", 1)[-1]
+    field = ".".join(str(part) for part in err.get("loc", ())[1:])
+    return f"{field}: {msg}" if field else msg
+
+
+def validate_batch(rows: List[Tuple[int, Any]]) -> Tuple[List[AnnouncementCreateRequest], Dict[int, List[str]]]:
+    """
+    Partiyi tek bir TypeAdapter çağrısıyla doğrular. Hata varsa hatalar
+    konumlarındaki liste indeksine göre satırlara dağıtılır ve geçerli satırlar
+    ikinci bir çağrıyla yeniden doğrulanır.
+    """
+    errors: Dict[int, List[str]] = {}
+    candidates = []
+    for row, data in rows:
+        if isinstance(data, dict):
+            candidates.append((row, data))
+        else:
+            errors[row] = ["Satır geçerli bir JSON nesnesi değil."]
+
+    try:
+        return announcement_batch_adapter.validate_python([data for _, data in candidates]), errors
+    except ValidationError as exc:
+        bad: Set[int] = set()
+        for err in exc.errors():
+            index = err["loc"][0]
+            bad.add(index)
+            errors.setdefault(candidates[index][0], []).append(_clean_message(err))
+        valid = [data for index, (_, data) in enumerate(candidates) if index not in bad]
+        return announcement_batch_adapter.validate_python(valid), errors
+
+
+def _record(item: AnnouncementCreateRequest) -> tuple:
+    fields = (getattr(item, field) for field in AnnouncementCreateRequest.model_fields)
+    return (uuid.uuid4(), *fields, is_open(item.application_deadline))
+
+
+async def insert_batch(items: List[AnnouncementCreateRequest]) -> None:
+    """
+    asyncpg bağlantısında COPY; başka bir sürücüde executemany'ye düşer.
+    Eklenen duyurular aynı transaction içinde kullanıcı feed'lerine dağıtılır.
+    """
+    records = [_record(item) for item in items]
+    async with AsyncSessionLocal() as db:
+        async with db.begin():
+            connection = await db.connection()
+            raw = (await connection.get_raw_connection()).driver_connection
+            if hasattr(raw, "copy_records_to_table"):
+                # asyncpg adaptörü transaction'ı ilk ifadede açar; COPY sürücüde
+                # doğrudan çalıştığından önce oturum üzerinden bir ifade gönderilir,
+                # böylece COPY ve fan-out aynı transaction'da commit/rollback olur
+                await connection.exec_driver_sql("SELECT 1")
+                await raw.copy_records_to_table(
+                    AnnouncementModel.__tablename__, records=records, columns=IMPORT_COLUMNS
+                )
+            else:
+                await db.execute(
+                    insert(AnnouncementModel.__table__),
+                    [dict(zip(IMPORT_COLUMNS, record)) for record in records]
+                )
+            await fan_out(db, [record[0] for record in records])
+
+
+async def import_announcements(stream: AsyncIterator[bytes], import_format: str) -> Tuple[AnnouncementImportResult, List[datetime]]:
+    """
+    Akışı içe aktarır; rapor ile birlikte eklenen duyuruların son başvuru
+    tarihlerini döner (cache geçersiz kılma için).
+    """
+    records = _csv_records(stream) if import_format == "csv" else _ndjson_records(stream)
+    inserted, failed = 0, 0
+    errors: List[AnnouncementImportError] = []
+    deadlines: List[datetime] = []
+
+    def report(row: int, messages: List[str]) -> None:
+        nonlocal failed
+        failed += 1
+        if len(errors) < MAX_REPORTED_ERRORS:
+            errors.append(AnnouncementImportError(row=row, errors=messages))
+
+    async def flush(batch: List[Tuple[int, Any]]) -> None:
+        nonlocal inserted
+        items, batch_errors = validate_batch(batch)
+        for row, messages in batch_errors.items():
+            report(row, messages)
+        if not items:
+            return
+        try:
+            await insert_batch(items)
+        except Exception as exc:
+            for row, _ in batch:
+                if row not in batch_errors:
+                    report(row, [f"Veritabanına yazılamadı: {exc}"])
+            return
+        inserted += len(items)
+        deadlines.extend(item.application_deadline for item in items)
+
+    batch: List[Tuple[int, Any]] = []
+    aborted: Optional[str] = None
+    try:
+        async for record in records:
+            batch.append(record)
+            if len(batch) >= IMPORT_BATCH_SIZE:
+                await flush(batch)
+                batch = []
+    except (RequestBodyTooLarge, ClientDisconnect, UnicodeDecodeError) as exc:
+        # Yarım kalan parti yazılmaz; önceki partiler commit edilmiş olarak raporlanır
+        aborted = _abort_reason(exc)
+    else:
+        if batch:
+            await flush(batch)
+
+    result = AnnouncementImportResult(
+        inserted=inserted,
+        failed=failed,
+        errors=sorted(errors, key=lambda error: error.row),
+        errors_truncated=failed > len(errors),
+        aborted=aborted,
+    )
+    return result, deadlines
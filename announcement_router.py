@@ -1,54 +1,181 @@
-from typing import List
+from typing import AsyncIterator, List, Literal, Optional, Sequence
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status, Request
-from sqlalchemy.orm import Session
-from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, Query, status, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Integer, cast, delete, func, literal, select
+from sqlalchemy.dialects.postgresql import REGCONFIG, insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime, timezone
+import csv
+import hashlib
+import io
+import json
 
-from slowapi import Limiter
-from slowapi.util import get_remote_address
-
-from database import get_db
-from models.announcement_model import AnnouncementModel
-from models.user_model import UserModel
+from announcement_import import import_announcements
+from cache import response_cache
+from content_encoding import COMPRESSION_MIN_SIZE, compress, negotiate
+from database import ReplicaSessionLocal, get_db, get_read_db, mark_recent_write
+from expiry_scheduler import expiry_scheduler, is_open
+from feed import fan_out, refresh_announcements
+from http_cache import make_etag, not_modified_etag, public_cache_headers, variant_etag
+from models.announcement_model import AnnouncementModel, SEARCH_CONFIG, saved_announcements, user_feed
+from pagination import PageParams, keyset_paginate
+from rate_limit import limiter
+from sql_instrumentation import query_budget
+from serialization import ANNOUNCEMENT_COLUMNS, FieldParams, dumps, page_json
 from schemas import (
     AnnouncementResponse,
+    AnnouncementPage,
     AnnouncementCreateRequest,
-    AnnouncementUpdateRequest
+    AnnouncementUpdateRequest,
+    AnnouncementBulkRequest,
+    AnnouncementBulkResult,
+    AnnouncementImportResult
 )
-from security import get_current_user, get_current_admin_user
+from dependencies import Principal, get_current_admin, get_current_principal, get_principal_read_db
 
 router = APIRouter(prefix="/announcements")
-limiter = Limiter(key_func=get_remote_address)
 
 # -------------------------------
 # 🔵 GENEL DUYURULAR (Token gerekmez)
 # -------------------------------
 
-@router.get("/all", response_model=List[AnnouncementResponse], tags=["Public Announcements"])
+ALL_SCOPE = "announcements:all"
+ACTIVE_SCOPE = "announcements:active"
+PASSIVE_SCOPE = "announcements:passive"
+SEARCH_SCOPE = "announcements:search"
+
+async def _announcement_page_json(db: AsyncSession, stmt, page: PageParams, sort_column=AnnouncementModel.created_at) -> bytes:
+    items, next_cursor = await keyset_paginate(
+        db, stmt, page, sort_column, AnnouncementModel.guid, as_mappings=True
+    )
+    return page_json(items, next_cursor)
+
+async def _cached_page(
+    request: Request,
+    db: AsyncSession,
+    scope: str,
+    page: PageParams,
+    stmt,
+    fields: FieldParams,
+    key_parts: Sequence[object] = (),
+    sort_column=AnnouncementModel.created_at
+) -> Response:
+    version = await response_cache.version(scope)
+    # Alan seçimi hem cache anahtarına hem ETag'e girer. Parçalar JSON olarak
+    # kodlanır; ayraç ya da boş değer yerine geçen metinler çakışamaz.
+    parts = json.dumps([*key_parts, fields.key, page.cursor, page.limit], ensure_ascii=False)
+    request_key = hashlib.sha1(parts.encode()).hexdigest()
+
+    surrogate_keys = ["announcements", scope.replace(":", "-")]
+    key = await response_cache.key(scope, request_key, version=version)
+
+    async def load() -> bytes:
+        return await _announcement_page_json(db, stmt, page, sort_column)
+
+    if response_cache.shared_versions:
+        # Sürüm tüm worker'larda ortaktır; doğrulayıcılar ondan türer ve 304 gövde okunmadan döner
+        etag = make_etag(scope, str(version), request_key)
+        headers = public_cache_headers(etag, version, surrogate_keys)
+        matched = not_modified_etag(request, etag, version)
+        if matched is not None:
+            headers["ETag"] = matched
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        body = await response_cache.get_or_load(key, load)
+    else:
+        # Süreç içi sürüm worker'a özeldir; ETag içerikten türetilir ki her
+        # worker aynı sayfa için aynı değeri versin. Last-Modified gönderilmez.
+        body = await response_cache.get_or_load(key, load)
+        etag = make_etag(scope, request_key, hashlib.sha1(body).hexdigest())
+        headers = public_cache_headers(etag, None, surrogate_keys)
+        matched = not_modified_etag(request, etag)
+        if matched is not None:
+            headers["ETag"] = matched
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    # Sıkıştırılmış hali de cache'lenir; sıcak listeler her istekte yeniden sıkıştırılmaz
+    encoding = negotiate(request.headers.get("accept-encoding"))
+    if encoding and len(body) >= COMPRESSION_MIN_SIZE:
+        body = await response_cache.get_or_load(f"{key}|{encoding}", lambda: compress(body, encoding))
+        headers["Content-Encoding"] = encoding
+        headers["ETag"] = variant_etag(etag, encoding)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+def _deadline_scope(deadline: datetime) -> str:
+    return ACTIVE_SCOPE if is_open(deadline) else PASSIVE_SCOPE
+
+async def _invalidate_lists(*deadlines: datetime) -> None:
+    await response_cache.invalidate(ALL_SCOPE, SEARCH_SCOPE, *{_deadline_scope(d) for d in deadlines})
+
+async def _on_expired(guids: List[UUID]) -> None:
+    # Süresi dolan duyurular aktiften pasife geçer; aramada active_only sonuçları da değişir
+    await response_cache.invalidate(SEARCH_SCOPE, ACTIVE_SCOPE, PASSIVE_SCOPE)
+
+expiry_scheduler.add_hook(_on_expired)
+
+@router.get("/all", response_model=AnnouncementPage, tags=["Public Announcements"], dependencies=[Depends(query_budget(1))])
 @limiter.limit("10/minute")
-def list_all_announcements(request: Request, db: Session = Depends(get_db)):
-    return db.query(AnnouncementModel).order_by(AnnouncementModel.created_at.desc()).all()
+async def list_all_announcements(
+    request: Request,
+    page: PageParams = Depends(),
+    fields: FieldParams = Depends(),
+    db: AsyncSession = Depends(get_read_db)
+):
+    return await _cached_page(request, db, ALL_SCOPE, page, select(*fields.columns), fields)
 
-@router.get("/active", response_model=List[AnnouncementResponse], tags=["Public Announcements"])
+@router.get("/active", response_model=AnnouncementPage, tags=["Public Announcements"], dependencies=[Depends(query_budget(1))])
 @limiter.limit("10/minute")
-def list_active_announcements(request: Request, db: Session = Depends(get_db)):
-    now = datetime.utcnow()
-    return (
-        db.query(AnnouncementModel)
-        .filter(AnnouncementModel.application_deadline > now)
-        .order_by(AnnouncementModel.created_at.desc())
-        .all()
+async def list_active_announcements(
+    request: Request,
+    page: PageParams = Depends(),
+    fields: FieldParams = Depends(),
+    db: AsyncSession = Depends(get_read_db)
+):
+    # is_active zamanlayıcı tarafından tutulur; sonuç zamana bağlı olmadığı için cache'lenebilir
+    return await _cached_page(
+        request, db, ACTIVE_SCOPE, page,
+        select(*fields.columns).where(AnnouncementModel.is_active),
+        fields
+    )
+
+@router.get("/passive", response_model=AnnouncementPage, tags=["Public Announcements"], dependencies=[Depends(query_budget(1))])
+@limiter.limit("10/minute")
+async def list_passive_announcements(
+    request: Request,
+    page: PageParams = Depends(),
+    fields: FieldParams = Depends(),
+    db: AsyncSession = Depends(get_read_db)
+):
+    return await _cached_page(
+        request, db, PASSIVE_SCOPE, page,
+        select(*fields.columns).where(~AnnouncementModel.is_active),
+        fields
     )
 
-@router.get("/passive", response_model=List[AnnouncementResponse], tags=["Public Announcements"])
+@router.get("/search", response_model=AnnouncementPage, tags=["Public Announcements"], dependencies=[Depends(query_budget(1))])
 @limiter.limit("10/minute")
-def list_passive_announcements(request: Request, db: Session = Depends(get_db)):
-    now = datetime.utcnow()
-    return (
-        db.query(AnnouncementModel)
-        .filter(AnnouncementModel.application_deadline <= now)
-        .order_by(AnnouncementModel.created_at.desc())
-        .all()
+async def search_announcements(
+    request: Request,
+    q: str = Query(..., min_length=2, max_length=200, description="Aranacak ifade (tırnak, OR ve - desteklenir)"),
+    active_only: bool = Query(False, description="Sadece başvurusu devam eden duyurular"),
+    sector: Optional[str] = Query(None, max_length=100, description="Sadece bu sektördeki duyurular"),
+    page: PageParams = Depends(),
+    fields: FieldParams = Depends(),
+    db: AsyncSession = Depends(get_read_db)
+):
+    # GIN indeksli tsvector eşleşmesi; sonuçlar (skor, guid) üzerinde keyset ile sayfalanır
+    query = func.websearch_to_tsquery(cast(SEARCH_CONFIG, REGCONFIG), q)
+    rank = func.ts_rank_cd(AnnouncementModel.search_vector, query)
+    stmt = select(*fields.columns).where(AnnouncementModel.search_vector.bool_op("@@")(query))
+    if active_only:
+        stmt = stmt.where(AnnouncementModel.is_active)
+    if sector:
+        stmt = stmt.where(AnnouncementModel.sectors.contains([sector]))
+
+    return await _cached_page(
+        request, db, SEARCH_SCOPE, page, stmt, fields,
+        key_parts=[" ".join(q.lower().split()), active_only, sector or None],
+        sort_column=rank
     )
 
 # -------------------------------
@@ -57,120 +184,285 @@ def list_passive_announcements(request: Request, db: Session = Depends(get_db)):
 
 @router.post("/", response_model=AnnouncementResponse, status_code=status.HTTP_201_CREATED, tags=["Admin Announcements"])
 @limiter.limit("5/minute")
-def create_announcement(
+async def create_announcement(
     request: Request,
     data: AnnouncementCreateRequest,
-    db: Session = Depends(get_db),
-    current_admin: UserModel = Depends(get_current_admin_user)
+    db: AsyncSession = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
 ):
     announcement = AnnouncementModel(**data.model_dump())
+    announcement.is_active = is_open(announcement.application_deadline)
     db.add(announcement)
-    db.commit()
-    db.refresh(announcement)
+    await db.flush()
+    await fan_out(db, [announcement.guid])
+    await db.commit()
+    await db.refresh(announcement)
+    expiry_scheduler.schedule(announcement.application_deadline)
+    await _invalidate_lists(announcement.application_deadline)
     return announcement
 
 @router.patch("/{announcement_guid}", response_model=AnnouncementResponse, tags=["Admin Announcements"])
 @limiter.limit("5/minute")
-def update_announcement(
+async def update_announcement(
     request: Request,
     announcement_guid: UUID,
     data: AnnouncementUpdateRequest,
-    db: Session = Depends(get_db),
-    current_admin: UserModel = Depends(get_current_admin_user)
+    db: AsyncSession = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
 ):
-    announcement = db.query(AnnouncementModel).filter_by(guid=announcement_guid).first()
+    announcement = await db.get(AnnouncementModel, announcement_guid)
     if not announcement:
         raise HTTPException(status_code=404, detail="Güncellenecek duyuru bulunamadı.")
 
+    old_deadline = announcement.application_deadline
+    old_feed_state = (list(announcement.sectors), announcement.is_active)
     for field, value in data.model_dump(exclude_unset=True).items():
         setattr(announcement, field, value)
+    # Tarih ileri alınırsa duyuru yeniden aktifleşir
+    announcement.is_active = is_open(announcement.application_deadline)
 
-    db.commit()
-    db.refresh(announcement)
+    if (list(announcement.sectors), announcement.is_active) != old_feed_state:
+        await db.flush()
+        await refresh_announcements(db, [announcement.guid])
+    await db.commit()
+    await db.refresh(announcement)
+    expiry_scheduler.schedule(announcement.application_deadline)
+    await _invalidate_lists(old_deadline, announcement.application_deadline)
     return announcement
 
+# Dışa aktarımda sunucu tarafı imleçten her seferinde çekilen satır sayısı
+EXPORT_BATCH_SIZE = 1000
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv; charset=utf-8"}
+
+def _csv_value(value) -> str:
+    if isinstance(value, list):
+        return "|".join(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+async def _export_rows(export_format: str) -> AsyncIterator[bytes]:
+    """
+    Duyuruları sunucu tarafı imleçle (yield_per) parça parça okuyup her parçayı
+    hemen gönderir; bellek kullanımı tablo boyutundan bağımsızdır. İstek
+    oturumu yanıt akarken kapanabileceği için kendi oturumunu açar.
+    """
+    if export_format == "csv":
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(column.key for column in ANNOUNCEMENT_COLUMNS)
+        yield buffer.getvalue().encode()
+
+    stmt = (
+        select(*ANNOUNCEMENT_COLUMNS)
+        .order_by(AnnouncementModel.created_at, AnnouncementModel.guid)
+        .execution_options(yield_per=EXPORT_BATCH_SIZE)
+    )
+    async with ReplicaSessionLocal() as db:
+        result = await db.stream(stmt)
+        async for rows in result.mappings().partitions():
+            if export_format == "csv":
+                buffer = io.StringIO()
+                writer = csv.writer(buffer)
+                writer.writerows([_csv_value(value) for value in row.values()] for row in rows)
+                yield buffer.getvalue().encode()
+            else:
+                yield b"".join(dumps(dict(row)) + b"\n" for row in rows)
+
+@router.get("/export", tags=["Admin Announcements"])
+@limiter.limit("2/minute")
+async def export_announcements(
+    request: Request,
+    export_format: Literal["ndjson", "csv"] = Query("ndjson", alias="format", description="Çıktı biçimi"),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    filename = f"announcements-{datetime.now(timezone.utc):%Y%m%d-%H%M%S}.{export_format}"
+    return StreamingResponse(
+        _export_rows(export_format),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"', "Cache-Control": "no-store"}
+    )
+
+IMPORT_PATH = "/announcements/import"
+
+@router.post("/import", response_model=AnnouncementImportResult, tags=["Admin Announcements"])
+@limiter.limit("2/minute")
+async def import_announcements_bulk(
+    request: Request,
+    import_format: Literal["ndjson", "csv"] = Query("ndjson", alias="format", description="Gövde biçimi"),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    # Gövde parametre olarak tanımlanmaz; tamamı belleğe alınmadan akış halinde işlenir
+    # Gövde yarıda kesilse de commit edilen partiler için cache ve zamanlayıcı güncellenir
+    result, deadlines = await import_announcements(request.stream(), import_format)
+    if result.inserted:
+        for deadline in deadlines:
+            expiry_scheduler.schedule(deadline)
+        await _invalidate_lists(*deadlines)
+        # get_db kullanılmadığı için okuma yönlendirmesi elle birincile sabitlenir
+        await mark_recent_write(current_admin)
+    return result
+
 @router.delete("/{announcement_guid}", status_code=status.HTTP_200_OK, tags=["Admin Announcements"])
 @limiter.limit("5/minute")
-def delete_announcement(
+async def delete_announcement(
     request: Request,
     announcement_guid: UUID,
-    db: Session = Depends(get_db),
-    current_admin: UserModel = Depends(get_current_admin_user)
+    db: AsyncSession = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
 ):
-    announcement = db.query(AnnouncementModel).filter_by(guid=announcement_guid).first()
+    announcement = await db.get(AnnouncementModel, announcement_guid)
     if not announcement:
         raise HTTPException(status_code=404, detail="Silinecek duyuru bulunamadı.")
 
-    db.delete(announcement)
-    db.commit()
+    deadline = announcement.application_deadline
+    await db.delete(announcement)
+    await db.commit()
+    await _invalidate_lists(deadline)
     return {"message": "Duyuru silindi."}
 
 # -------------------------------
 # 🟡 KULLANICI DUYURULARI (Token zorunlu)
 # -------------------------------
 
-@router.get("/by-sector", response_model=List[AnnouncementResponse], tags=["User Announcements"])
+@router.get("/by-sector", response_model=AnnouncementPage, tags=["User Announcements"], dependencies=[Depends(query_budget(2))])
 @limiter.limit("10/minute")
-def list_announcements_by_user_sector(
+async def list_announcements_by_user_sector(
     request: Request,
-    db: Session = Depends(get_db),
-    current_user: UserModel = Depends(get_current_user)
+    page: PageParams = Depends(),
+    fields: FieldParams = Depends(),
+    db: AsyncSession = Depends(get_principal_read_db),
+    principal: Principal = Depends(get_current_principal)
 ):
-    return (
-        db.query(AnnouncementModel)
-        .filter(AnnouncementModel.sectors.overlap(current_user.sectors))
-        .order_by(AnnouncementModel.created_at.desc())
-        .all()
+    # Feed yazma anında doldurulur; okuma (user_id, created_at, guid) indeksinde aralık taramasıdır
+    stmt = (
+        select(*fields.columns)
+        .join(user_feed, user_feed.c.announcement_guid == AnnouncementModel.guid)
+        .where(user_feed.c.user_id == principal.id, AnnouncementModel.is_active)
     )
+    items, next_cursor = await keyset_paginate(
+        db, stmt, page, user_feed.c.created_at, user_feed.c.announcement_guid, as_mappings=True
+    )
+    return Response(content=page_json(items, next_cursor), media_type="application/json")
 
 # -------------------------------
 # 🟣 KAYDEDİLEN DUYURULAR (Token zorunlu)
 # -------------------------------
 
+async def _save_many(db: AsyncSession, user_id: int, guids: List[UUID]) -> List[UUID]:
+    """
+    Var olan duyuruları tek bir INSERT ... SELECT ... ON CONFLICT DO NOTHING ile
+    kaydeder ve gerçekten eklenen guid'leri döner. Kullanıcının kayıt sayısından
+    bağımsız olarak birincil anahtar üzerinde çalışır.
+    """
+    stmt = (
+        pg_insert(saved_announcements)
+        .from_select(
+            ["user_id", "announcement_guid"],
+            select(literal(user_id, Integer), AnnouncementModel.guid)
+            .where(AnnouncementModel.guid.in_(guids))
+        )
+        .on_conflict_do_nothing()
+        .returning(saved_announcements.c.announcement_guid)
+    )
+    return list((await db.execute(stmt)).scalars())
+
+async def _unsave_many(db: AsyncSession, user_id: int, guids: List[UUID]) -> List[UUID]:
+    stmt = (
+        delete(saved_announcements)
+        .where(
+            saved_announcements.c.user_id == user_id,
+            saved_announcements.c.announcement_guid.in_(guids)
+        )
+        .returning(saved_announcements.c.announcement_guid)
+    )
+    return list((await db.execute(stmt)).scalars())
+
 @router.post("/{announcement_guid}/save", status_code=status.HTTP_200_OK, tags=["Saved Announcements"])
 @limiter.limit("10/minute")
-def save_announcement(
+async def save_announcement(
     request: Request,
     announcement_guid: UUID,
-    db: Session = Depends(get_db),
-    current_user: UserModel = Depends(get_current_user)
+    db: AsyncSession = Depends(get_db),
+    principal: Principal = Depends(get_current_principal)
 ):
-    announcement = db.query(AnnouncementModel).filter_by(guid=announcement_guid).first()
-    if not announcement:
-        raise HTTPException(status_code=404, detail="Duyuru bulunamadı.")
-
-    if announcement in current_user.saved_announcements:
+    if not await _save_many(db, principal.id, [announcement_guid]):
+        # Hiç satır eklenmediyse nedeni sadece hata yolunda ayrıca sorgulanır
+        if await db.get(AnnouncementModel, announcement_guid) is None:
+            raise HTTPException(status_code=404, detail="Duyuru bulunamadı.")
         raise HTTPException(status_code=400, detail="Bu duyuru zaten kaydedilmiş.")
 
-    current_user.saved_announcements.append(announcement)
-    db.commit()
+    await db.commit()
     return {"message": "Duyuru başarıyla kaydedildi."}
 
-@router.get("/saved", response_model=List[AnnouncementResponse], tags=["Saved Announcements"])
+@router.post("/saved/bulk-save", response_model=AnnouncementBulkResult, tags=["Saved Announcements"])
+@limiter.limit("10/minute")
+async def bulk_save_announcements(
+    request: Request,
+    data: AnnouncementBulkRequest,
+    db: AsyncSession = Depends(get_db),
+    principal: Principal = Depends(get_current_principal)
+):
+    guids = list(dict.fromkeys(data.guids))
+    saved = await _save_many(db, principal.id, guids)
+    await db.commit()
+    saved_set = set(saved)
+    return AnnouncementBulkResult(
+        processed=saved,
+        skipped=[guid for guid in guids if guid not in saved_set]
+    )
+
+@router.get("/saved", response_model=AnnouncementPage, tags=["Saved Announcements"], dependencies=[Depends(query_budget(2))])
 @limiter.limit("10/minute")
-def list_saved_announcements(
+async def list_saved_announcements(
     request: Request,
-    db: Session = Depends(get_db),
-    current_user: UserModel = Depends(get_current_user)
+    page: PageParams = Depends(),
+    since: Optional[datetime] = Query(None, description="Sadece bu tarihten sonra kaydedilenler"),
+    fields: FieldParams = Depends(),
+    db: AsyncSession = Depends(get_principal_read_db),
+    principal: Principal = Depends(get_current_principal)
 ):
-    return sorted(
-        current_user.saved_announcements,
-        key=lambda a: a.created_at,
-        reverse=True
+    stmt = (
+        select(*fields.columns)
+        .join(saved_announcements, saved_announcements.c.announcement_guid == AnnouncementModel.guid)
+        .where(saved_announcements.c.user_id == principal.id)
     )
+    if since is not None:
+        stmt = stmt.where(saved_announcements.c.saved_at >= since)
+
+    items, next_cursor = await keyset_paginate(
+        db, stmt, page, saved_announcements.c.saved_at, saved_announcements.c.announcement_guid,
+        as_mappings=True
+    )
+    return Response(content=page_json(items, next_cursor), media_type="application/json")
 
 @router.delete("/{announcement_guid}/unsave", status_code=status.HTTP_200_OK, tags=["Saved Announcements"])
 @limiter.limit("10/minute")
-def unsave_announcement(
+async def unsave_announcement(
     request: Request,
     announcement_guid: UUID,
-    db: Session = Depends(get_db),
-    current_user: UserModel = Depends(get_current_user)
+    db: AsyncSession = Depends(get_db),
+    principal: Principal = Depends(get_current_principal)
 ):
-    announcement = db.query(AnnouncementModel).filter_by(guid=announcement_guid).first()
-    if not announcement or announcement not in current_user.saved_announcements:
+    if not await _unsave_many(db, principal.id, [announcement_guid]):
         raise HTTPException(status_code=404, detail="Kaldırılacak duyuru bulunamadı.")
 
-    current_user.saved_announcements.remove(announcement)
-    db.commit()
-    return {"message": "Duyuru kaydı kaldırıldı."}
\ No newline at end of file
+    await db.commit()
+    return {"message": "Duyuru kaydı kaldırıldı."}
+
+@router.post("/saved/bulk-unsave", response_model=AnnouncementBulkResult, tags=["Saved Announcements"])
+@limiter.limit("10/minute")
+async def bulk_unsave_announcements(
+    request: Request,
+    data: AnnouncementBulkRequest,
+    db: AsyncSession = Depends(get_db),
+    principal: Principal = Depends(get_current_principal)
+):
+    guids = list(dict.fromkeys(data.guids))
+    removed = await _unsave_many(db, principal.id, guids)
+    await db.commit()
+    removed_set = set(removed)
+    return AnnouncementBulkResult(
+        processed=removed,
+        skipped=[guid for guid in guids if guid not in removed_set]
+    )
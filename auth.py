@@ -2,12 +2,16 @@ import os
 from dotenv import load_dotenv
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from database import get_db
 from models.user_model import UserModel, RoleEnum, PasswordModel
+from models.loaders import USER_WITH_PASSWORD
 from schemas import RegisterRequest, LoginRequest, TokenResponse
-from security import hash_password, verify_password, create_access_token
+from passwords import password_needs_rehash
+from sql_instrumentation import query_budget
+from security import hash_password, hash_password_async, verify_password_async, create_access_token
 
 load_dotenv()
 
@@ -20,8 +24,9 @@ router = APIRouter(
 )
 
 @router.post("/register/email", response_model=TokenResponse, status_code=status.HTTP_201_CREATED)
-def register_user(data: RegisterRequest, db: Session = Depends(get_db)):
-    if db.query(UserModel).filter(UserModel.email == data.email).first():
+async def register_user(data: RegisterRequest, db: AsyncSession = Depends(get_db)):
+    existing = await db.execute(select(UserModel.id).where(UserModel.email == data.email))
+    if existing.first():
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Bu email zaten kayıtlı."
@@ -38,23 +43,29 @@ def register_user(data: RegisterRequest, db: Session = Depends(get_db)):
         sectors=[]
     )
     db.add(user)
-    db.flush()
+    await db.flush()
 
+    # bcrypt CPU yoğun: ayrılmış, boyutu sınırlı şifre executor'ında çalışır
     password_entry = PasswordModel(
         user_id=user.id,
-        hashed_password=hash_password(data.password)
+        hashed_password=await hash_password_async(data.password)
     )
     db.add(password_entry)
 
-    db.commit()
-    db.refresh(user)
+    await db.commit()
 
     token = create_access_token(user)
     return TokenResponse(access_token=token)
 
-@router.post("/login/email", response_model=TokenResponse)
-def login_user(data: LoginRequest, db: Session = Depends(get_db)):
-    user = db.query(UserModel).filter(UserModel.email == data.email).first()
+# Kullanıcı + şifre (selectinload) ve gerekirse rehash güncellemesi
+@router.post("/login/email", response_model=TokenResponse, dependencies=[Depends(query_budget(3))])
+async def login_user(data: LoginRequest, db: AsyncSession = Depends(get_db)):
+    result = await db.execute(
+        select(UserModel)
+        .options(*USER_WITH_PASSWORD)
+        .where(UserModel.email == data.email)
+    )
+    user = result.scalars().first()
 
     if not user or not user.password_entry:
         raise HTTPException(
@@ -62,12 +73,17 @@ def login_user(data: LoginRequest, db: Session = Depends(get_db)):
             detail="Email veya şifre hatalı."
         )
 
-    if not verify_password(data.password, user.password_entry.hashed_password):
+    if not await verify_password_async(data.password, user.password_entry.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Email veya şifre hatalı."
         )
 
+    # bcrypt maliyeti değiştiyse hash, kullanıcı fark etmeden yenilenir
+    if password_needs_rehash(user.password_entry.hashed_password):
+        user.password_entry.hashed_password = await hash_password_async(data.password)
+        await db.commit()
+
     token = create_access_token(user)
     return TokenResponse(access_token=token)
 
@@ -75,7 +91,12 @@ def create_admin_if_not_exists():
     from database import SessionLocal
     db = SessionLocal()
 
-    admin = db.query(UserModel).filter(UserModel.email == ADMIN_EMAIL).first()
+    admin = (
+        db.query(UserModel)
+        .options(*USER_WITH_PASSWORD)
+        .filter(UserModel.email == ADMIN_EMAIL)
+        .first()
+    )
 
     if not admin:
         admin = UserModel(
@@ -86,7 +107,8 @@ def create_admin_if_not_exists():
             linkedin="",
             institution="",
             profession="",
-            sectors=[]
+            sectors=[],
+            password_entry=None
         )
         db.add(admin)
         db.flush()
@@ -99,5 +121,4 @@ def create_admin_if_not_exists():
         db.add(password_entry)
 
     db.commit()
-    db.refresh(admin)
     db.close()
\ No newline at end of file
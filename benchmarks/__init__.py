@@ -0,0 +1,2 @@
+# benchmarks/__init__.py
+# Performans ölçüm betikleri. Çalıştırma örnekleri her modülün başındadır.
@@ -0,0 +1,256 @@
+"""
+Benchmark veri setleri: yerel bir Postgres'i ölçek faktörüne göre COPY ile
+doldurur. Üretim sabit tohumla yapılır; aynı ölçek her seferinde aynı
+dağılımı verir, böylece farklı commit'lerin ölçümleri karşılaştırılabilir.
+
+    alembic upgrade head
+    python -m benchmarks.datasets --scale medium --reset
+
+Dağılımlar:
+  - sektör popülerliği Zipf benzeri (birkaç sektör çok, çoğu az duyuru alır)
+  - duyuruların ~yarısı aktif, oluşturulma tarihleri iki yıla yayılır
+  - kullanıcı başına kayıt sayısı üstel dağılır ve yeni duyurulara yığılır
+
+Seed kullanıcıları `bench-<n>@example.com` ve `bench-admin@example.com`
+adresleriyle, BENCH_PASSWORD şifresiyle oluşturulur.
+"""
+import argparse
+import asyncio
+import random
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Iterator, List, Sequence, Tuple
+
+from sqlalchemy import text
+
+from database import async_engine
+from feed import sync_feeds
+from models.announcement_model import AnnouncementModel, saved_announcements, user_feed
+from models.user_model import PasswordModel, RoleEnum, UserModel
+from passwords import hash_password
+from sector_router import SECTOR_LIST
+
+SECTORS = [sector.name for sector in SECTOR_LIST]
+COPY_BATCH_SIZE = 50_000
+BENCH_PASSWORD = "bench-password-123"
+BENCH_EMAIL_DOMAIN = "example.com"
+ADMIN_EMAIL = f"bench-admin@{BENCH_EMAIL_DOMAIN}"
+SEED = 42
+
+ANNOUNCEMENT_COLUMNS = [
+    "guid", "title", "description", "announcement_date", "application_deadline",
+    "eligible_institution", "sectors", "is_active", "created_at",
+    "image_url", "link", "project_duration", "budget_support", "application_language",
+]
+USER_COLUMNS = [
+    "id", "email", "full_name", "role", "is_active", "created_at",
+    "phone", "linkedin", "institution", "profession", "sectors", "token_version",
+]
+PASSWORD_COLUMNS = ["user_id", "hashed_password"]
+SAVED_COLUMNS = ["user_id", "announcement_guid", "saved_at"]
+
+TITLE_WORDS = [
+    "hibe", "destek", "teşvik", "programı", "Ar-Ge", "ihracat", "dijital", "dönüşüm",
+    "yenilenebilir", "enerji", "girişim", "KOBİ", "inovasyon", "kırsal", "kalkınma",
+    "istihdam", "eğitim", "yazılım", "tarım", "turizm", "sağlık", "üretim", "yatırım",
+]
+INSTITUTIONS = ["KOBİ", "Büyük İşletme", "Üniversite", "STK", "Kamu Kurumu", "Girişimci"]
+
+
+@dataclass(frozen=True)
+class Scale:
+    announcements: int
+    users: int
+    saved_mean: float = 20.0
+
+
+SCALES = {
+    "small": Scale(announcements=10_000, users=1_000),
+    "medium": Scale(announcements=100_000, users=10_000),
+    "large": Scale(announcements=1_000_000, users=100_000),
+}
+
+
+class _SectorPicker:
+    """Zipf benzeri ağırlıklarla, tekrarsız sektör seçimi."""
+
+    def __init__(self, rng: random.Random, exponent: float = 1.1):
+        self.rng = rng
+        self.sectors = list(SECTORS)
+        rng.shuffle(self.sectors)
+        self.weights = [1 / (rank + 1) ** exponent for rank in range(len(self.sectors))]
+
+    def pick(self, count: int) -> List[str]:
+        count = min(count, len(self.sectors))
+        chosen: List[str] = []
+        while len(chosen) < count:
+            sector = self.rng.choices(self.sectors, self.weights)[0]
+            if sector not in chosen:
+                chosen.append(sector)
+        return chosen
+
+
+def _batches(rows: Iterator[tuple], size: int = COPY_BATCH_SIZE) -> Iterator[List[tuple]]:
+    batch: List[tuple] = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def announcement_rows(count: int, rng: random.Random, now: datetime, guids: List[uuid.UUID]) -> Iterator[tuple]:
+    """Satırlar yeniden eskiye üretilir; guids listesi aynı sırayla doldurulur."""
+    picker = _SectorPicker(rng)
+    span = timedelta(days=730)
+    for i in range(count):
+        guid = uuid.UUID(int=rng.getrandbits(128), version=4)
+        guids.append(guid)
+        created_at = now - span * (i / max(count, 1)) - timedelta(seconds=rng.randint(0, 3600))
+        deadline = created_at + timedelta(days=rng.randint(7, 365))
+        words = rng.sample(TITLE_WORDS, 3)
+        yield (
+            guid,
+            f"{' '.join(words).capitalize()} {i}",
+            f"{' '.join(rng.sample(TITLE_WORDS, 12))}. Benchmark için üretilmiş duyuru.",
+            created_at - timedelta(days=rng.randint(0, 14)),
+            deadline,
+            rng.sample(INSTITUTIONS, rng.randint(1, 3)),
+            picker.pick(rng.choices((1, 2, 3), (0.5, 0.35, 0.15))[0]),
+            deadline > now,
+            created_at,
+            "", f"https://example.com/duyuru/{i}", f"{rng.randint(6, 36)} ay",
+            f"{rng.randint(1, 50) * 100_000} TL", "Türkçe",
+        )
+
+
+def user_rows(count: int, first_id: int, rng: random.Random, now: datetime) -> Iterator[tuple]:
+    picker = _SectorPicker(random.Random(SEED))
+    yield (
+        first_id, ADMIN_EMAIL, "Benchmark Admin", RoleEnum.ADMIN.name, True, now,
+        "", "", "", "", [], 0,
+    )
+    for i in range(count):
+        yield (
+            first_id + 1 + i, f"bench-{i}@{BENCH_EMAIL_DOMAIN}", f"Benchmark Kullanıcı {i}",
+            RoleEnum.USER.name, True, now - timedelta(days=rng.randint(0, 730)),
+            "", "", "", "", picker.pick(rng.randint(1, 4)), 0,
+        )
+
+
+def saved_rows(user_ids: Sequence[int], guids: Sequence[uuid.UUID], mean: float,
+               rng: random.Random, now: datetime) -> Iterator[tuple]:
+    if not guids:
+        return
+    for user_id in user_ids:
+        count = min(int(rng.expovariate(1 / mean)), 200, len(guids))
+        picked = set()
+        while len(picked) < count:
+            # random()**3 indeksi listenin başına (yeni duyurulara) yığar
+            picked.add(guids[int(len(guids) * rng.random() ** 3)])
+        for guid in picked:
+            yield user_id, guid, now - timedelta(minutes=rng.randint(0, 90 * 24 * 60))
+
+
+async def _copy(raw, table: str, columns: List[str], rows: Iterator[tuple]) -> int:
+    total = 0
+    for batch in _batches(rows):
+        await raw.copy_records_to_table(table, records=batch, columns=columns)
+        total += len(batch)
+    return total
+
+
+async def seed(scale: Scale, reset: bool = False) -> Tuple[int, int, int]:
+    """
+    Veri setini tek transaction'da yükler, ardından feed'leri doldurur;
+    (duyuru, kullanıcı, kayıt) sayısını döner.
+    """
+    rng = random.Random(SEED)
+    now = datetime.now(timezone.utc)
+    guids: List[uuid.UUID] = []
+    password_hash = hash_password(BENCH_PASSWORD)
+
+    # COPY doğrudan asyncpg bağlantısında çalışır; transaction da orada açılır
+    async with async_engine.connect() as connection:
+        raw = (await connection.get_raw_connection()).driver_connection
+        async with raw.transaction():
+            # Büyük ölçeklerde COPY/ANALYZE DB_STATEMENT_TIMEOUT_MS'i aşabilir
+            await raw.execute("SET LOCAL statement_timeout = 0")
+            if reset:
+                await raw.execute(
+                    f"TRUNCATE {saved_announcements.name}, {AnnouncementModel.__tablename__} CASCADE"
+                )
+                await raw.execute(
+                    f"DELETE FROM {UserModel.__tablename__} WHERE email LIKE 'bench-%@{BENCH_EMAIL_DOMAIN}'"
+                )
+
+            announcements = await _copy(
+                raw, AnnouncementModel.__tablename__, ANNOUNCEMENT_COLUMNS,
+                announcement_rows(scale.announcements, rng, now, guids)
+            )
+
+            first_id = (await raw.fetchval(f"SELECT coalesce(max(id), 0) FROM {UserModel.__tablename__}")) + 1
+            users = await _copy(
+                raw, UserModel.__tablename__, USER_COLUMNS, user_rows(scale.users, first_id, rng, now)
+            )
+            await raw.execute(
+                f"SELECT setval(pg_get_serial_sequence('{UserModel.__tablename__}', 'id'), "
+                f"(SELECT max(id) FROM {UserModel.__tablename__}))"
+            )
+            user_ids = range(first_id, first_id + users)
+            await _copy(
+                raw, PasswordModel.__tablename__, PASSWORD_COLUMNS,
+                ((user_id, password_hash) for user_id in user_ids)
+            )
+            saved = await _copy(
+                raw, saved_announcements.name, SAVED_COLUMNS,
+                saved_rows(user_ids[1:], guids, scale.saved_mean, rng, now)
+            )
+
+            for table in (AnnouncementModel.__tablename__, UserModel.__tablename__, saved_announcements.name):
+                await raw.execute(f"ANALYZE {table}")
+
+    # Kullanıcı feed'leri uygulamadaki backfill yoluyla doldurulur
+    await sync_feeds()
+    async with async_engine.begin() as connection:
+        await connection.execute(text(f"ANALYZE {user_feed.name}"))
+    await async_engine.dispose()
+    return announcements, users, saved
+
+
+def scale_from_args(args) -> Scale:
+    base = SCALES[args.scale]
+    return Scale(
+        announcements=args.announcements if args.announcements is not None else base.announcements,
+        users=args.users if args.users is not None else base.users,
+        saved_mean=args.saved_mean if args.saved_mean is not None else base.saved_mean,
+    )
+
+
+def add_scale_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--scale", choices=sorted(SCALES), default="small")
+    parser.add_argument("--announcements", type=int, help="Ölçeğin duyuru sayısını ezer")
+    parser.add_argument("--users", type=int, help="Ölçeğin kullanıcı sayısını ezer")
+    parser.add_argument("--saved-mean", type=float, help="Kullanıcı başına ortalama kayıt sayısı")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    add_scale_arguments(parser)
+    parser.add_argument("--reset", action="store_true", help="Önce duyuruları ve seed kullanıcılarını siler")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    announcements, users, saved = asyncio.run(seed(scale_from_args(args), args.reset))
+    print(
+        f"{announcements} duyuru, {users} kullanıcı, {saved} kayıt "
+        f"{time.perf_counter() - started:.1f} sn'de yüklendi"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+HTTP yük ölçümü: bir endpoint'e sabit eşzamanlılıkla istek atar, saniyedeki
+istek sayısını ve gecikme yüzdeliklerini raporlar.
+
+Senkron ve asenkron veritabanı katmanını karşılaştırmak için aynı komut iki
+sürüm üzerinde çalıştırılır (rate limit kapalı, tek worker):
+
+    RATE_LIMIT_ENABLED=false uvicorn main:app --workers 1
+    python -m benchmarks.http_load --url http://localhost:8000/announcements/by-sector \\
+        --token <jwt> --concurrency 256 --duration 30
+
+Cache'lenen genel listeler DB'ye gitmediği için DB beklemesini ölçmek üzere
+token gerektiren uçlar (ör. /announcements/by-sector) tercih edilmelidir.
+"""
+import argparse
+import asyncio
+import json
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import httpx
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def summarize(latencies: List[float], errors: int, elapsed: float) -> Dict[str, float]:
+    latencies = sorted(latencies)
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "elapsed_s": round(elapsed, 3),
+        "rps": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+    }
+
+
+async def run(
+    url: str,
+    concurrency: int,
+    duration: float,
+    token: Optional[str] = None,
+    method: str = "GET",
+    body: Optional[bytes] = None,
+    tokens: Sequence[str] = (),
+    cycle: Sequence[Tuple[str, str]] = (),
+) -> Dict[str, float]:
+    """
+    tokens verilirse her worker farklı bir kullanıcıyla istek atar (kullanıcı
+    başına cache'ler ve sorgular gerçekçi dağılsın diye). cycle verilirse her
+    worker method/url yerine bu (method, url) çiftlerini sırayla tekrarlar;
+    ör. kaydet/kaldır gibi durum değiştiren istekler hep aynı durumda kalmaz.
+    """
+    tokens = list(tokens) or ([token] if token else [])
+    steps = list(cycle) or [(method, url)]
+    content_headers = {"Content-Type": "application/json"} if body is not None else {}
+    latencies: List[float] = []
+    errors = 0
+    deadline = time.perf_counter() + duration
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(limits=limits, timeout=30.0) as client:
+        async def worker(index: int):
+            nonlocal errors
+            headers = dict(content_headers)
+            if tokens:
+                headers["Authorization"] = f"Bearer {tokens[index % len(tokens)]}"
+            step = 0
+            # Döngü yarıda bırakılmaz; sonraki ölçüm aynı başlangıç durumunu görür
+            while step % len(steps) or time.perf_counter() < deadline:
+                step_method, step_url = steps[step % len(steps)]
+                step += 1
+                start = time.perf_counter()
+                try:
+                    response = await client.request(step_method, step_url, headers=headers, content=body)
+                except httpx.HTTPError:
+                    errors += 1
+                    continue
+                if response.status_code >= 400:
+                    errors += 1
+                    continue
+                latencies.append(time.perf_counter() - start)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(i) for i in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    return summarize(latencies, errors, elapsed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", required=True)
+    parser.add_argument("--token")
+    parser.add_argument("--concurrency", type=int, default=256)
+    parser.add_argument("--duration", type=float, default=30.0)
+    args = parser.parse_args()
+
+    result = asyncio.run(run(args.url, args.concurrency, args.duration, args.token))
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
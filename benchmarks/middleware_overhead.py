@@ -0,0 +1,117 @@
+"""
+Middleware mikro ölçümü: sunucu olmadan doğrudan ASGI çağrılarıyla istek
+başına middleware maliyetini ölçer.
+
+    python -m benchmarks.middleware_overhead --requests 20000
+
+Karşılaştırılan yığınlar:
+  - bare:     sadece uygulama
+  - legacy:   önceki BaseHTTPMiddleware yığını (URL engelleyici + gövde sınırı
+              + SlowAPIMiddleware), davranışı buraya birebir kopyalanmıştır
+  - pipeline: middlewares.pipeline.RequestPipelineMiddleware
+"""
+import argparse
+import asyncio
+import json
+import time
+
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from slowapi import Limiter
+from slowapi.middleware import SlowAPIMiddleware
+from slowapi.util import get_remote_address
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import Response
+
+from middlewares.pipeline import RequestPipelineMiddleware
+
+PATH = "/announcements/all"
+MAX_BODY_SIZE = 1024 * 1024
+
+
+def build_inner() -> FastAPI:
+    inner = FastAPI()
+
+    @inner.get(PATH)
+    async def endpoint(limit: int = 20):
+        return Response(b'{"items":[],"next_cursor":null}', media_type="application/json")
+
+    inner.state.limiter = Limiter(key_func=get_remote_address)
+    return inner
+
+
+async def legacy_blocker(request, call_next):
+    url_str = str(request.url)
+    if request.url.path.startswith(("/docs", "/redoc", "/openapi.json", "/favicon.ico")):
+        return await call_next(request)
+    if any(char in url_str for char in ["<", ">", "script"]):
+        return JSONResponse(status_code=400, content={"success": False})
+    return await call_next(request)
+
+
+async def legacy_body_limit(request, call_next):
+    content_length = request.headers.get("content-length")
+    if content_length and int(content_length) > MAX_BODY_SIZE:
+        return JSONResponse(status_code=200, content={"success": False})
+    return await call_next(request)
+
+
+def build_stacks():
+    bare = build_inner()
+
+    legacy_inner = build_inner()
+    legacy = BaseHTTPMiddleware(
+        BaseHTTPMiddleware(SlowAPIMiddleware(legacy_inner), dispatch=legacy_body_limit),
+        dispatch=legacy_blocker,
+    )
+
+    pipeline_inner = build_inner()
+    pipeline = RequestPipelineMiddleware(
+        pipeline_inner,
+        limiter=pipeline_inner.state.limiter,
+        max_body_size=MAX_BODY_SIZE,
+    )
+    return {"bare": (bare, bare), "legacy": (legacy, legacy_inner), "pipeline": (pipeline, pipeline_inner)}
+
+
+async def drive(app, inner, requests: int) -> float:
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    base_scope = {
+        "type": "http", "http_version": "1.1", "method": "GET", "scheme": "http",
+        "path": PATH, "raw_path": PATH.encode(), "root_path": "",
+        "query_string": b"limit=20", "headers": [(b"host", b"localhost")],
+        "client": ("127.0.0.1", 12345), "server": ("localhost", 8000), "app": inner,
+    }
+
+    started = time.perf_counter()
+    for _ in range(requests):
+        await app(dict(base_scope), receive, send)
+    return time.perf_counter() - started
+
+
+async def run(requests: int):
+    results = {}
+    for name, (app, inner) in build_stacks().items():
+        await drive(app, inner, min(1000, requests))  # ısınma
+        elapsed = await drive(app, inner, requests)
+        results[name] = {"us_per_request": round(elapsed / requests * 1_000_000, 2)}
+    bare = results["bare"]["us_per_request"]
+    for name, result in results.items():
+        result["overhead_us"] = round(result["us_per_request"] - bare, 2)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20000)
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(run(args.requests)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Sorgu planı regresyon kontrolü: sıcak liste sorgularını seed edilmiş yerel bir
+Postgres üzerinde EXPLAIN ile çalıştırır; büyük tablolardan birinde Seq Scan'e
+düşen plan varsa sıfırdan farklı kodla çıkar.
+
+    alembic upgrade head
+    python -m benchmarks.plan_check --seed-announcements 50000 --seed-users 5000
+
+Seed yapılmadan çalıştırılırsa mevcut veriler kullanılır. Küçük tablolarda
+planlayıcı haklı olarak Seq Scan seçer; kontrol anlamlı ölçekte yapılmalıdır.
+"""
+import argparse
+import asyncio
+import json
+import sys
+from datetime import datetime, timezone
+from typing import Dict, List
+
+from sqlalchemy import cast, func, select
+from sqlalchemy.dialects.postgresql import REGCONFIG
+
+from benchmarks.datasets import SECTORS, Scale, seed
+from database import engine
+from models.announcement_model import AnnouncementModel, SEARCH_CONFIG, saved_announcements, user_feed
+from models.user_model import UserModel
+
+GUARDED_TABLES = {"announcements", "users", "saved_announcements", "user_feed"}
+PAGE_SIZE = 20
+
+
+def hot_queries(user_id: int, sectors: List[str]) -> Dict[str, object]:
+    now = datetime.now(timezone.utc)
+    created_at, guid = AnnouncementModel.created_at, AnnouncementModel.guid
+
+    def first_page(stmt):
+        return stmt.order_by(created_at.desc(), guid.desc()).limit(PAGE_SIZE + 1)
+
+    search_query = func.websearch_to_tsquery(cast(SEARCH_CONFIG, REGCONFIG), "duyuru 4242")
+
+    return {
+        "GET /announcements/all": first_page(select(AnnouncementModel)),
+        "GET /announcements/active": first_page(
+            select(AnnouncementModel).where(AnnouncementModel.is_active)
+        ),
+        "GET /announcements/passive": first_page(
+            select(AnnouncementModel).where(~AnnouncementModel.is_active)
+        ),
+        "GET /announcements/search": (
+            select(AnnouncementModel)
+            .where(AnnouncementModel.search_vector.bool_op("@@")(search_query))
+            .order_by(func.ts_rank_cd(AnnouncementModel.search_vector, search_query).desc(), guid.desc())
+            .limit(PAGE_SIZE + 1)
+        ),
+        "GET /announcements/by-sector": (
+            select(AnnouncementModel)
+            .join(user_feed, user_feed.c.announcement_guid == guid)
+            .where(user_feed.c.user_id == user_id, AnnouncementModel.is_active)
+            .order_by(user_feed.c.created_at.desc(), user_feed.c.announcement_guid.desc())
+            .limit(PAGE_SIZE + 1)
+        ),
+        "GET /announcements/saved": (
+            select(AnnouncementModel)
+            .join(saved_announcements, saved_announcements.c.announcement_guid == guid)
+            .where(saved_announcements.c.user_id == user_id)
+            .order_by(saved_announcements.c.saved_at.desc(), saved_announcements.c.announcement_guid.desc())
+            .limit(PAGE_SIZE + 1)
+        ),
+        "expiry scheduler due announcements": (
+            select(AnnouncementModel.guid)
+            .where(AnnouncementModel.is_active, AnnouncementModel.application_deadline <= now)
+            .limit(1000)
+        ),
+        "users matching announcement sectors": (
+            select(UserModel.id).where(UserModel.sectors.overlap(sectors[:1]))
+        ),
+    }
+
+
+def seq_scans(plan: dict) -> List[str]:
+    found = []
+    if plan.get("Node Type") == "Seq Scan" and plan.get("Relation Name") in GUARDED_TABLES:
+        found.append(plan["Relation Name"])
+    for child in plan.get("Plans", []):
+        found.extend(seq_scans(child))
+    return found
+
+
+def explain(conn, stmt) -> dict:
+    compiled = stmt.compile(dialect=conn.dialect)
+    raw = conn.exec_driver_sql("EXPLAIN (FORMAT JSON) " + compiled.string, compiled.params).scalar()
+    if isinstance(raw, str):
+        raw = json.loads(raw)
+    return raw[0]["Plan"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seed-announcements", type=int, default=0)
+    parser.add_argument("--seed-users", type=int, default=0)
+    parser.add_argument("--saved-per-user", type=float, default=20, help="Kullanıcı başına ortalama kayıt sayısı")
+    args = parser.parse_args()
+
+    if args.seed_announcements or args.seed_users:
+        asyncio.run(seed(Scale(args.seed_announcements, args.seed_users, args.saved_per_user)))
+
+    with engine.begin() as conn:
+        user_id = conn.execute(select(func.min(UserModel.id))).scalar() or 0
+        failures = 0
+        for name, stmt in hot_queries(user_id, SECTORS[:2]).items():
+            scans = seq_scans(explain(conn, stmt))
+            status = "SEQ SCAN: " + ", ".join(scans) if scans else "ok"
+            print(f"{name:<40} {status}")
+            failures += bool(scans)
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
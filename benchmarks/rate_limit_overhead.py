@@ -0,0 +1,78 @@
+"""
+Rate limiter mikro ölçümü: depolama/strateji kombinasyonları için istek başına
+limiter maliyetini ve çok süreçli paylaşımın doğruluğunu ölçer.
+
+    python -m benchmarks.rate_limit_overhead --hits 50000 --workers 4
+
+Tek süreç ölçümünde istemci anahtarları --keys adet IP arasında döner.
+Çok süreç ölçümünde her worker aynı anahtara vurur; paylaşımlı depoda kabul
+edilen toplam istek limitle aynı olmalıdır (süreç içi bellekte worker sayısı
+kadar katlanır).
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import tempfile
+import time
+
+from limits import parse
+from limits.storage import storage_from_string
+from limits.strategies import STRATEGIES
+
+import rate_limit_storage  # noqa: F401  "shm://" şemasını kaydeder
+
+STRATEGY_NAMES = ("fixed-window", "sliding-window-counter")
+
+
+def storage_uris(path: str):
+    return {"memory": "memory://", "shm": f"shm://{path}?slots=65536&stripes=64"}
+
+
+def per_hit_cost(uri: str, strategy: str, hits: int, keys: int) -> float:
+    limiter = STRATEGIES[strategy](storage_from_string(uri))
+    item = parse("1000000/minute")
+    identifiers = [f"10.0.{i // 256}.{i % 256}" for i in range(keys)]
+    started = time.perf_counter()
+    for i in range(hits):
+        limiter.hit(item, identifiers[i % keys], "global")
+    return (time.perf_counter() - started) / hits * 1_000_000
+
+
+def _shared_worker(args) -> int:
+    uri, strategy, limit, hits = args
+    limiter = STRATEGIES[strategy](storage_from_string(uri))
+    item = parse(f"{limit}/minute")
+    return sum(limiter.hit(item, "shared-client", "global") for _ in range(hits))
+
+
+def shared_granted(uri: str, strategy: str, workers: int, limit: int) -> int:
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(workers) as pool:
+        return sum(pool.map(_shared_worker, [(uri, strategy, limit, limit)] * workers))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--hits", type=int, default=50000)
+    parser.add_argument("--keys", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--limit", type=int, default=500)
+    args = parser.parse_args()
+
+    results = {}
+    with tempfile.TemporaryDirectory(dir="/dev/shm" if os.path.isdir("/dev/shm") else None) as tmp:
+        for strategy in STRATEGY_NAMES:
+            for name, uri in storage_uris(os.path.join(tmp, strategy)).items():
+                results[f"{name}/{strategy}"] = {
+                    "us_per_hit": round(per_hit_cost(uri, strategy, args.hits, args.keys), 2),
+                    "granted_across_workers": shared_granted(uri, strategy, args.workers, args.limit),
+                    "limit": args.limit,
+                }
+                storage_from_string(uri).reset()
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Liste yanıtı serileştirme ölçümü: aynı sentetik duyuru sayfasını eski ve yeni
+yollarla JSON baytına çevirir ve saniyede işlenen satır sayısını raporlar.
+Veritabanı gerekmez; satırlar bellekte üretilir.
+
+    python -m benchmarks.serialization --rows 20000 --repeat 5
+
+Yollar:
+  - fastapi_response_model: ORM nesnesi -> response_model doğrulaması
+    (from_attributes) -> jsonable_encoder -> json.dumps
+  - pydantic_model_dump_json: ORM nesnesi -> AnnouncementPage -> model_dump_json
+  - core_rows: Core satır sözlükleri -> serialization.page_json (orjson ya da
+    pydantic-core), doğrulama yok
+"""
+import argparse
+import json
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from typing import Callable, Dict, List
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+import serialization
+from schemas import AnnouncementPage, AnnouncementResponse
+
+
+def make_rows(count: int) -> List[Dict[str, object]]:
+    now = datetime.now(timezone.utc)
+    return [
+        {
+            "guid": uuid.uuid4(),
+            "title": f"Duyuru {i}",
+            "description": "Hibe programı açıklaması. " * 20,
+            "announcement_date": now - timedelta(days=i % 365),
+            "application_deadline": now + timedelta(days=i % 90),
+            "image_url": "https://example.com/image.png",
+            "link": "https://example.com/duyuru",
+            "eligible_institution": ["KOBİ", "Üniversite"],
+            "project_duration": "12 ay",
+            "budget_support": "500.000 TL",
+            "application_language": "Türkçe",
+            "sectors": ["Bilişim", "Enerji"],
+            "created_at": now - timedelta(seconds=i),
+        }
+        for i in range(count)
+    ]
+
+
+def measure(fn: Callable[[], bytes], rows: int, repeat: int) -> Dict[str, float]:
+    fn()  # ısınma
+    best = float("inf")
+    size = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        size = len(fn())
+        best = min(best, time.perf_counter() - started)
+    return {"rows_per_sec": round(rows / best), "ms": round(best * 1000, 2), "bytes": size}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    orm_objects = [SimpleNamespace(**row) for row in rows]
+    response_adapter = TypeAdapter(AnnouncementPage)
+
+    def fastapi_response_model() -> bytes:
+        validated = response_adapter.validate_python(
+            {"items": orm_objects, "next_cursor": None}, from_attributes=True
+        )
+        return json.dumps(jsonable_encoder(validated)).encode()
+
+    def pydantic_model_dump_json() -> bytes:
+        items = [AnnouncementResponse.model_validate(obj) for obj in orm_objects]
+        return AnnouncementPage(items=items, next_cursor=None).model_dump_json().encode()
+
+    def core_rows() -> bytes:
+        return serialization.page_json(rows, None)
+
+    results = {
+        "fastapi_response_model": measure(fastapi_response_model, args.rows, args.repeat),
+        "pydantic_model_dump_json": measure(pydantic_model_dump_json, args.rows, args.repeat),
+        "core_rows": measure(core_rows, args.rows, args.repeat),
+        "encoder": "orjson" if serialization.orjson is not None else "pydantic_core",
+    }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,252 @@
+"""
+Uçtan uca yük ölçümü: main.py'deki tüm router'ları sabit eşzamanlılıkla
+sırayla yükler; her senaryo için rps ve p50/p95/p99 gecikmeyi JSON olarak
+kaydeder ve verilen baseline'a göre gerilemeleri işaretler.
+
+    alembic upgrade head
+    python -m benchmarks.datasets --scale medium --reset
+    RATE_LIMIT_ENABLED=false uvicorn main:app --workers 1
+    python -m benchmarks.suite --scale medium --concurrency 64 --duration 20 \\
+        --baseline benchmarks/results/baseline-medium.json
+
+İlk çalıştırmada --save-baseline ile sonuç baseline olarak yazılır. Sonraki
+çalıştırmalarda p95 ya da rps tolerans dışına çıkarsa (varsayılan %15) veya
+hata sayısı artarsa sıfırdan farklı kodla çıkılır. Token'lar seed
+kullanıcıları için doğrudan imzalanır; login senaryosu bcrypt maliyetini ölçer.
+"""
+import argparse
+import asyncio
+import json
+import subprocess
+import sys
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import exists, select
+
+from benchmarks.datasets import (
+    ADMIN_EMAIL, BENCH_EMAIL_DOMAIN, BENCH_PASSWORD, add_scale_arguments, scale_from_args, seed,
+)
+from benchmarks.http_load import run
+from database import engine
+from main import app
+from models.announcement_model import AnnouncementModel, saved_announcements
+from models.user_model import UserModel
+from security import create_access_token
+
+RESULTS_DIR = Path(__file__).parent / "results"
+TOKEN_POOL_SIZE = 500
+# bcrypt ve tam tablo akışı yüksek eşzamanlılıkta ölçümü değil kuyruğu gösterir
+LOGIN_CONCURRENCY = 16
+EXPORT_CONCURRENCY = 2
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    method: str
+    # Route adı (endpoint fonksiyonu); path app.routes'tan çözülür, prefix değişince kaymaz
+    route: str
+    query: str = ""
+    auth: Optional[str] = None  # None | "user" | "admin"
+    body: Optional[dict] = None
+    concurrency: Optional[int] = None
+    # Verilirse worker'lar method/route yerine bu (method, route) çiftlerini sırayla atar
+    cycle: Tuple[Tuple[str, str], ...] = ()
+
+
+def scenarios() -> List[Scenario]:
+    return [
+        Scenario("health", "GET", "health_check"),
+        Scenario("sectors", "GET", "get_sectors"),
+        Scenario("announcements_all", "GET", "list_all_announcements", "limit=20"),
+        Scenario("announcements_all_summary", "GET", "list_all_announcements", "view=summary&limit=100"),
+        Scenario("announcements_active", "GET", "list_active_announcements", "limit=20"),
+        Scenario("announcements_passive", "GET", "list_passive_announcements", "limit=20"),
+        Scenario("announcements_search", "GET", "search_announcements", "q=hibe%20destek&limit=20"),
+        Scenario("announcements_by_sector", "GET", "list_announcements_by_user_sector", "limit=20", auth="user"),
+        Scenario("announcements_saved", "GET", "list_saved_announcements", "limit=20", auth="user"),
+        # Her worker kendi kullanıcısıyla aynı duyuruyu sırayla kaydedip kaldırır;
+        # duyuru hiçbir seed kullanıcısınca kaydedilmemiştir, böylece 400/404 dönmez
+        Scenario(
+            "announcements_save_unsave", "POST", "save_announcement", auth="user",
+            cycle=(("POST", "save_announcement"), ("DELETE", "unsave_announcement")),
+        ),
+        Scenario("users_me", "GET", "get_me", auth="user"),
+        Scenario(
+            "auth_login", "POST", "login_user",
+            body={"email": f"bench-0@{BENCH_EMAIL_DOMAIN}", "password": BENCH_PASSWORD},
+            concurrency=LOGIN_CONCURRENCY,
+        ),
+        Scenario(
+            "announcements_export", "GET", "export_announcements", "format=ndjson",
+            auth="admin", concurrency=EXPORT_CONCURRENCY,
+        ),
+    ]
+
+
+def resolve_path(route: str, path_params: Dict[str, str]) -> str:
+    """Route adını uygulamanın gerçekte sunduğu path'e çevirir."""
+    for candidate in app.routes:
+        if getattr(candidate, "name", None) == route:
+            params = {name: path_params[name] for name in candidate.param_convertors}
+            return str(candidate.url_path_for(route, **params))
+    raise KeyError(f"Route bulunamadı: {route}")
+
+
+def load_fixtures() -> Dict[str, object]:
+    """Seed kullanıcıları için token'ları imzalar ve kimsenin kaydetmediği bir duyuru seçer."""
+    with engine.connect() as conn:
+        users = conn.execute(
+            select(UserModel.id, UserModel.role, UserModel.sectors, UserModel.token_version)
+            .where(UserModel.email.like(f"bench-%@{BENCH_EMAIL_DOMAIN}"), UserModel.email != ADMIN_EMAIL)
+            .order_by(UserModel.id)
+            .limit(TOKEN_POOL_SIZE)
+        ).all()
+        admin = conn.execute(
+            select(UserModel.id, UserModel.role, UserModel.sectors, UserModel.token_version)
+            .where(UserModel.email == ADMIN_EMAIL)
+        ).first()
+        guid = conn.execute(
+            select(AnnouncementModel.guid)
+            .where(~exists().where(saved_announcements.c.announcement_guid == AnnouncementModel.guid))
+            .order_by(AnnouncementModel.created_at.desc())
+            .limit(1)
+        ).scalar()
+    engine.dispose()
+
+    if not users or admin is None or guid is None:
+        sys.exit("Seed verisi bulunamadı; önce `python -m benchmarks.datasets` çalıştırın.")
+
+    def token(row) -> str:
+        return create_access_token(
+            UserModel(id=row.id, role=row.role, sectors=row.sectors, token_version=row.token_version)
+        )
+
+    return {
+        "user": [token(row) for row in users],
+        "admin": [token(admin)],
+        "guid": str(guid),
+    }
+
+
+async def run_suite(args, fixtures: Dict[str, object]) -> Dict[str, Dict[str, float]]:
+    results = {}
+    base_url = args.base_url.rstrip("/")
+    path_params = {"announcement_guid": fixtures["guid"]}
+
+    def url(route: str, query: str = "") -> str:
+        path = base_url + resolve_path(route, path_params)
+        return f"{path}?{query}" if query else path
+
+    for scenario in scenarios():
+        if args.only and not any(part in scenario.name for part in args.only):
+            continue
+        concurrency = min(args.concurrency, scenario.concurrency or args.concurrency)
+        if scenario.cycle and scenario.auth:
+            # Aynı kullanıcıyı paylaşan iki worker birbirinin kaydını bozar
+            concurrency = min(concurrency, len(fixtures[scenario.auth]))
+        options = dict(
+            url=url(scenario.route, scenario.query),
+            cycle=[(method, url(route)) for method, route in scenario.cycle],
+            concurrency=concurrency,
+            method=scenario.method,
+            body=json.dumps(scenario.body).encode() if scenario.body is not None else None,
+            tokens=fixtures[scenario.auth] if scenario.auth else (),
+        )
+        if args.warmup:
+            await run(duration=args.warmup, **options)
+        result = await run(duration=args.duration, **options)
+        result["concurrency"] = concurrency
+        results[scenario.name] = result
+        print(
+            f"{scenario.name:<28} {result['rps']:>9.1f} rps  p50 {result['p50_ms']:>8.2f}  "
+            f"p95 {result['p95_ms']:>8.2f}  p99 {result['p99_ms']:>8.2f} ms  hata {result['errors']}"
+        )
+    return results
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]], tolerance: float) -> List[str]:
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        if current["p95_ms"] > previous["p95_ms"] * (1 + tolerance):
+            regressions.append(f"{name}: p95 {previous['p95_ms']} -> {current['p95_ms']} ms")
+        if current["rps"] < previous["rps"] * (1 - tolerance):
+            regressions.append(f"{name}: rps {previous['rps']} -> {current['rps']}")
+        if current["errors"] > previous["errors"]:
+            regressions.append(f"{name}: hata {previous['errors']} -> {current['errors']}")
+    return regressions
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    add_scale_arguments(parser)
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--duration", type=float, default=20.0)
+    parser.add_argument("--warmup", type=float, default=3.0, help="Ölçülmeyen ısınma süresi (sn)")
+    parser.add_argument("--only", nargs="*", help="Sadece adı bu parçaları içeren senaryolar")
+    parser.add_argument("--seed", action="store_true", help="Ölçümden önce veri setini sıfırdan yükler")
+    parser.add_argument("--output", type=Path, help="Sonuç dosyası (varsayılan: benchmarks/results/)")
+    parser.add_argument("--baseline", type=Path, help="Karşılaştırılacak sonuç dosyası")
+    parser.add_argument("--save-baseline", action="store_true", help="Sonucu --baseline yoluna yazar")
+    parser.add_argument("--tolerance", type=float, default=0.15)
+    args = parser.parse_args()
+
+    scale = scale_from_args(args)
+    if args.seed:
+        asyncio.run(seed(scale, reset=True))
+
+    started_at = datetime.now(timezone.utc)
+    results = asyncio.run(run_suite(args, load_fixtures()))
+    report = {
+        "meta": {
+            "started_at": started_at.isoformat(),
+            "revision": git_revision(),
+            "scale": args.scale,
+            "announcements": scale.announcements,
+            "users": scale.users,
+            "concurrency": args.concurrency,
+            "duration_s": args.duration,
+        },
+        "results": results,
+    }
+
+    output = args.output or RESULTS_DIR / f"{args.scale}-{started_at:%Y%m%dT%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    print(f"Sonuçlar: {output}")
+
+    if not args.baseline:
+        return
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(report, indent=2))
+        print(f"Baseline yazıldı: {args.baseline}")
+        return
+
+    baseline = json.loads(args.baseline.read_text())
+    if baseline["meta"].get("scale") != args.scale:
+        print(f"⚠️ Baseline farklı ölçekte alınmış: {baseline['meta'].get('scale')}")
+    regressions = compare(results, baseline["results"], args.tolerance)
+    for line in regressions:
+        print(f"GERİLEME {line}")
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
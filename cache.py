@@ -0,0 +1,248 @@
+import asyncio
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Optional
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logger = logging.getLogger("uvicorn.error")
+
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "memory")
+CACHE_URL = os.getenv("CACHE_URL", "redis://localhost:6379/0")
+CACHE_TTL_SECONDS = int(os.getenv("CACHE_TTL_SECONDS", 60))
+CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", 1024))
+# uvicorn --workers ile aynı değer; memory backend'in paylaşılmadığını uyarmak için
+WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", 1))
+
+# Paylaşımlı backend'de aynı anahtarı yükleyen diğer süreçleri bekleme süresi
+LOAD_LOCK_TTL_SECONDS = 10
+LOAD_WAIT_SECONDS = 2.0
+LOAD_POLL_INTERVAL = 0.05
+
+
+# -------------------------------
+# 🧱 Backend'ler
+# -------------------------------
+
+class CacheBackend:
+    shared = False
+
+    async def get(self, key: str) -> Optional[bytes]:
+        raise NotImplementedError
+
+    async def set(self, key: str, value: bytes, ttl: Optional[int] = None) -> None:
+        raise NotImplementedError
+
+    async def add(self, key: str, value: bytes, ttl: Optional[int] = None) -> bool:
+        """Anahtar yoksa yazar; yazdıysa True döner."""
+        raise NotImplementedError
+
+    async def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    Süreç içi LRU + TTL cache. Her uvicorn worker'ının kendi kopyası olur.
+    Metotlar içinde await noktası olmadığı için event loop üzerinde atomiktir.
+    """
+
+    def __init__(self, max_entries: int = CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._data: "OrderedDict[str, tuple]" = OrderedDict()
+
+    async def get(self, key: str) -> Optional[bytes]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: bytes, ttl: Optional[int] = None) -> None:
+        expires_at = time.monotonic() + ttl if ttl else None
+        self._data[key] = (value, expires_at)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
+
+    async def add(self, key: str, value: bytes, ttl: Optional[int] = None) -> bool:
+        entry = self._data.get(key)
+        if entry is not None and (entry[1] is None or entry[1] > time.monotonic()):
+            return False
+        await self.set(key, value, ttl)
+        return True
+
+    async def delete(self, key: str) -> None:
+        self._data.pop(key, None)
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Worker'lar arasında paylaşılan backend. redis.asyncio arayüzüne
+    (get/set/delete) uyan herhangi bir istemciyle çalışır; testlerde
+    fakeredis.FakeAsyncRedis verilebilir.
+    """
+    shared = True
+
+    def __init__(self, client):
+        self.client = client
+
+    @classmethod
+    def from_url(cls, url: str) -> "RedisCacheBackend":
+        try:
+            from redis import asyncio as redis_asyncio
+        except ImportError:
+            raise RuntimeError("CACHE_BACKEND=redis için 'redis' paketi kurulu olmalıdır.")
+        return cls(redis_asyncio.Redis.from_url(url))
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self.client.get(key)
+
+    async def set(self, key: str, value: bytes, ttl: Optional[int] = None) -> None:
+        await self.client.set(key, value, ex=ttl)
+
+    async def add(self, key: str, value: bytes, ttl: Optional[int] = None) -> bool:
+        return bool(await self.client.set(key, value, ex=ttl, nx=True))
+
+    async def delete(self, key: str) -> None:
+        await self.client.delete(key)
+
+
+_warned_memory_workers = False
+
+
+def build_cache_backend() -> CacheBackend:
+    global _warned_memory_workers
+    if CACHE_BACKEND == "memory":
+        if WEB_CONCURRENCY > 1 and not _warned_memory_workers:
+            _warned_memory_workers = True
+            logger.warning(
+                f"⚠️ CACHE_BACKEND=memory {WEB_CONCURRENCY} worker ile kullanılıyor: cache worker başınadır, "
+                f"yazmalar diğer worker'larda en fazla {CACHE_TTL_SECONDS} sn gecikmeyle görünür ve ETag'ler "
+                f"gövde okunduktan sonra hesaplanır. CACHE_BACKEND=redis önerilir."
+            )
+        return MemoryCacheBackend()
+    if CACHE_BACKEND == "redis":
+        return RedisCacheBackend.from_url(CACHE_URL)
+    raise RuntimeError(f"Bilinmeyen CACHE_BACKEND: {CACHE_BACKEND}")
+
+
+# -------------------------------
+# 📦 Yanıt cache'i
+# -------------------------------
+
+class ResponseCache:
+    """
+    Kapsam (scope) bazlı sürümlenen yanıt cache'i.
+
+    Her kapsamın bir sürüm numarası vardır ve anahtarlar bu sürümü içerir;
+    invalidate() sürümü ilerletince o kapsamdaki tüm eski girdiler erişilemez
+    hale gelir ve TTL ile temizlenir. Aynı anahtar için eşzamanlı ıskalamalar
+    tek bir yüklemeye indirgenir.
+
+    Sürümler süresizdir. Süreç içi backend'de invalidate() yalnızca kendi
+    worker'ını görür; diğer worker'lar eski sürümle kalır ama girdileri TTL ile
+    düşüp veritabanından yeniden yüklenir. Bu yüzden sürümden türeyen
+    doğrulayıcılar (ETag, Last-Modified) yalnızca paylaşımlı backend'de
+    kararlıdır; bkz. shared_versions.
+    """
+
+    def __init__(self, backend: CacheBackend, ttl: int = CACHE_TTL_SECONDS, versions: Optional[CacheBackend] = None):
+        self.backend = backend
+        self.ttl = ttl
+        # Sürümler yanıtlarla aynı LRU'da tutulmaz; yüksek kardinaliteli arama
+        # girdileri bir sürümü tahliye edip kapsamın tamamını geçersiz kılamaz
+        self.versions = versions or backend
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    @property
+    def shared_versions(self) -> bool:
+        """Sürümler tüm worker'larda aynı mı (HTTP doğrulayıcısı olarak kullanılabilir mi)."""
+        return self.versions.shared
+
+    async def version(self, scope: str) -> int:
+        version_key = f"ver:{scope}"
+        raw = await self.versions.get(version_key)
+        if raw is None:
+            # Sürüm kaybolduysa (yeni süreç, Redis tahliyesi) zamana dayalı yeni bir değerle
+            # başlamak eski anahtarların asla geri dönmemesini sağlar.
+            await self.versions.add(version_key, str(time.time_ns()).encode())
+            raw = await self.versions.get(version_key)
+        return int(raw)
+
+    async def invalidate(self, *scopes: str) -> None:
+        for scope in scopes:
+            version = max(time.time_ns(), await self.version(scope) + 1)
+            await self.versions.set(f"ver:{scope}", str(version).encode())
+
+    async def key(self, scope: str, *parts: str, version: Optional[int] = None) -> str:
+        if version is None:
+            version = await self.version(scope)
+        return ":".join(["resp", scope, str(version), *parts])
+
+    async def get_or_load(self, key: str, loader: Callable[[], Awaitable[bytes]]) -> bytes:
+        value = await self.backend.get(key)
+        if value is not None:
+            return value
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            # Bekleyen isteğin iptali ortak yüklemeyi iptal etmemeli
+            return await asyncio.shield(inflight)
+
+        inflight = asyncio.get_running_loop().create_future()
+        self._inflight[key] = inflight
+        try:
+            value = await self._load(key, loader)
+            inflight.set_result(value)
+            return value
+        except asyncio.CancelledError:
+            inflight.cancel()
+            raise
+        except Exception as exc:
+            inflight.set_exception(exc)
+            inflight.exception()  # bekleyen yoksa "never retrieved" uyarısını engelle
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _load(self, key: str, loader: Callable[[], Awaitable[bytes]]) -> bytes:
+        if not self.backend.shared:
+            value = await loader()
+            await self.backend.set(key, value, self.ttl)
+            return value
+
+        # Paylaşımlı backend: diğer worker'lar aynı anahtarı yüklüyorsa onları bekle
+        lock_key = f"lock:{key}"
+        acquired = await self.backend.add(lock_key, b"1", LOAD_LOCK_TTL_SECONDS)
+        if not acquired:
+            deadline = time.monotonic() + LOAD_WAIT_SECONDS
+            while time.monotonic() < deadline:
+                await asyncio.sleep(LOAD_POLL_INTERVAL)
+                value = await self.backend.get(key)
+                if value is not None:
+                    return value
+        try:
+            value = await loader()
+            await self.backend.set(key, value, self.ttl)
+            return value
+        finally:
+            if acquired:
+                await self.backend.delete(lock_key)
+
+
+def build_response_cache() -> ResponseCache:
+    backend = build_cache_backend()
+    # Paylaşımlı backend'de sürümler kalıcı anahtarlardır; süreç içinde ayrı bir sözlükte tutulur
+    return ResponseCache(backend, versions=backend if backend.shared else MemoryCacheBackend())
+
+
+response_cache = build_response_cache()
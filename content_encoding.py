@@ -0,0 +1,69 @@
+import gzip
+import os
+from typing import Optional
+
+from dotenv import load_dotenv
+from starlette.concurrency import run_in_threadpool
+
+try:
+    import brotli
+except ImportError:  # brotli opsiyoneldir; yoksa sadece gzip sunulur
+    brotli = None
+
+load_dotenv()
+
+# -------------------------------
+# 🗜️ Yanıt sıkıştırma
+# -------------------------------
+
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", 1024))
+# Bu boyutun üzerindeki gövdeler event loop'u bloklamamak için thread'de sıkıştırılır
+COMPRESSION_OFFLOAD_SIZE = int(os.getenv("COMPRESSION_OFFLOAD_SIZE", 64 * 1024))
+GZIP_LEVEL = int(os.getenv("GZIP_LEVEL", 6))
+BROTLI_QUALITY = int(os.getenv("BROTLI_QUALITY", 5))
+
+# Tercih sırasına göre; q değerleri eşitse ilk sıradaki seçilir
+SUPPORTED_ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+COMPRESSIBLE_TYPES = ("application/json", "application/x-ndjson", "text/")
+
+
+def negotiate(accept_encoding: Optional[str]) -> Optional[str]:
+    """Accept-Encoding başlığına göre desteklenen en iyi kodlamayı seçer."""
+    if not accept_encoding:
+        return None
+    weights = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.partition(";")
+        weight = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                weight = float(params[2:])
+            except ValueError:
+                weight = 0.0
+        weights[name.strip().lower()] = weight
+
+    best, best_weight = None, 0.0
+    for encoding in SUPPORTED_ENCODINGS:
+        weight = weights.get(encoding, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = encoding, weight
+    return best
+
+
+def is_compressible(content_type: Optional[str]) -> bool:
+    return bool(content_type) and content_type.startswith(COMPRESSIBLE_TYPES)
+
+
+def compress_sync(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    # mtime=0: aynı gövde her zaman aynı baytları üretir
+    return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+async def compress(body: bytes, encoding: str) -> bytes:
+    # zlib ve brotli sıkıştırma sırasında GIL'i bırakır
+    if len(body) >= COMPRESSION_OFFLOAD_SIZE:
+        return await run_in_threadpool(compress_sync, body, encoding)
+    return compress_sync(body, encoding)
@@ -1,27 +1,258 @@
+import logging
 import os
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+import time
+from typing import Dict, Optional
+from fastapi import Request
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.exc import DisconnectionError
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy.orm import Session, sessionmaker, declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 from dotenv import load_dotenv
 
+from cache import build_cache_backend
+from metrics import Gauge, histogram_family
+from sql_instrumentation import instrument_engine
+
 
 load_dotenv()
 
+logger = logging.getLogger("uvicorn.error")
+
 
 DATABASE_URL = os.getenv("DATABASE_URL")
 if not DATABASE_URL:
     raise RuntimeError("DATABASE_URL environment variable is missing.")
 
 
-engine = create_engine(DATABASE_URL, pool_pre_ping=True)
+def _async_url(url: str) -> str:
+    return make_url(url).set(drivername="postgresql+asyncpg").render_as_string(hide_password=False)
+
+
+# Uygulama asyncpg sürücüsüyle çalışır; ayrı bir URL verilmezse DATABASE_URL'den türetilir
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL") or _async_url(DATABASE_URL)
+
+# Opsiyonel okuma replikası; verilmezse tüm okumalar birincil veritabanına gider
+DATABASE_REPLICA_URL = os.getenv("DATABASE_REPLICA_URL")
+ASYNC_DATABASE_REPLICA_URL = os.getenv("ASYNC_DATABASE_REPLICA_URL") or (
+    _async_url(DATABASE_REPLICA_URL) if DATABASE_REPLICA_URL else None
+)
+
+# -------------------------------
+# ⚙️ Havuz ayarları
+# -------------------------------
+
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 10))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 10))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", 1800))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", 30))
+DB_STATEMENT_TIMEOUT_MS = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", 15000))
+# pool_pre_ping yerine: sadece bu süreden uzun boşta kalmış bağlantılar pinglenir
+DB_POOL_PING_IDLE_SECONDS = float(os.getenv("DB_POOL_PING_IDLE_SECONDS", 30))
+# Kullanıcının kendi yazmasından sonra okumalarının birincile gittiği süre
+DB_READ_STICKY_SECONDS = int(os.getenv("DB_READ_STICKY_SECONDS", 5))
+
+
+# -------------------------------
+# 📊 Havuz metrikleri
+# -------------------------------
+
+POOL_CHECKOUT_WAIT = histogram_family(
+    "db_pool_checkout_wait_seconds", "Havuzdan bağlantı almak için beklenen süre", ("engine",)
+)
+
+
+class _CheckoutTimer:
+    """Bağlantı alma süresini (boş bağlantı bekleme dahil) ölçen havuz karışımı."""
+
+    metrics_label = "sync"
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            POOL_CHECKOUT_WAIT.labels(self.metrics_label).observe(time.perf_counter() - started)
+
+
+class InstrumentedQueuePool(_CheckoutTimer, QueuePool):
+    metrics_label = "sync"
+
+
+class InstrumentedAsyncPool(_CheckoutTimer, AsyncAdaptedQueuePool):
+    metrics_label = "async"
+
+
+class InstrumentedReplicaPool(_CheckoutTimer, AsyncAdaptedQueuePool):
+    metrics_label = "replica"
+
+
+def _pool_options(poolclass) -> Dict[str, object]:
+    return {
+        "poolclass": poolclass,
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_timeout": DB_POOL_TIMEOUT,
+    }
+
+
+def _ping_idle_connections(engine: Engine) -> None:
+    """
+    Her checkout'ta ping atmak yerine, bağlantı DB_POOL_PING_IDLE_SECONDS'tan
+    uzun süre havuzda beklediyse pinglenir. Ping başarısızsa DisconnectionError
+    havuzun bağlantıyı atıp yenisini denemesini sağlar.
+    """
+
+    @event.listens_for(engine, "checkin")
+    def _checkin(dbapi_connection, connection_record):
+        connection_record.info["checked_in_at"] = time.monotonic()
+
+    @event.listens_for(engine, "checkout")
+    def _checkout(dbapi_connection, connection_record, connection_proxy):
+        checked_in_at = connection_record.info.get("checked_in_at")
+        if checked_in_at is None or time.monotonic() - checked_in_at < DB_POOL_PING_IDLE_SECONDS:
+            return
+        try:
+            alive = engine.dialect.do_ping(dbapi_connection)
+        except Exception as exc:
+            raise DisconnectionError() from exc
+        if alive is False:
+            raise DisconnectionError()
+
+
+def _setup_engine(engine: Engine) -> None:
+    _ping_idle_connections(engine)
+    # Sorgu sayısı/süresi, yavaş sorgu logu ve N+1 tespiti
+    instrument_engine(engine)
+
+
+def _create_async_engine(url: str, poolclass) -> AsyncEngine:
+    async_engine = create_async_engine(
+        url,
+        connect_args={"server_settings": {"statement_timeout": str(DB_STATEMENT_TIMEOUT_MS)}},
+        **_pool_options(poolclass),
+    )
+    _setup_engine(async_engine.sync_engine)
+    return async_engine
+
+
+# Senkron engine: Alembic, create_all ve admin bootstrap için korunur
+engine = create_engine(
+    DATABASE_URL,
+    connect_args={"options": f"-c statement_timeout={DB_STATEMENT_TIMEOUT_MS}"},
+    **_pool_options(InstrumentedQueuePool),
+)
+_setup_engine(engine)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Asenkron engine: tüm router'lar bunu kullanır
+async_engine = _create_async_engine(ASYNC_DATABASE_URL, InstrumentedAsyncPool)
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+# Okuma replikası: liste/arama route'ları ve dışa aktarım bunu kullanır
+async_replica_engine: Optional[AsyncEngine] = (
+    _create_async_engine(ASYNC_DATABASE_REPLICA_URL, InstrumentedReplicaPool)
+    if ASYNC_DATABASE_REPLICA_URL else None
+)
+ReplicaSessionLocal = async_sessionmaker(
+    bind=async_replica_engine or async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+
+def _pool_stats(stat: str):
+    def collect():
+        pools = {("sync",): engine.pool, ("async",): async_engine.sync_engine.pool}
+        if async_replica_engine is not None:
+            pools[("replica",)] = async_replica_engine.sync_engine.pool
+        return {label: float(getattr(pool, stat)()) for label, pool in pools.items()}
+    return collect
+
+
+Gauge("db_pool_size", "Havuzun kalıcı bağlantı sayısı", _pool_stats("size"), ("engine",))
+Gauge("db_pool_checked_out", "Kullanımdaki bağlantı sayısı", _pool_stats("checkedout"), ("engine",))
+Gauge("db_pool_checked_in", "Havuzda boşta bekleyen bağlantı sayısı", _pool_stats("checkedin"), ("engine",))
+Gauge("db_pool_overflow", "Havuz boyutunu aşan (overflow) bağlantı sayısı", _pool_stats("overflow"), ("engine",))
+
 
 Base = declarative_base()
 
 
-def get_db():
-    db = SessionLocal()
-    try:
+# -------------------------------
+# 🔀 Okuma yönlendirme ve read-your-writes
+# -------------------------------
+# Commit eden istekte kimliği doğrulanmış bir kullanıcı varsa, o kullanıcının
+# okumaları DB_READ_STICKY_SECONDS boyunca birincile gider. Admin yazmaları
+# herkese açık listeleri etkilediği için tüm okumaları aynı süre birincile
+# yönlendirir; böylece replika gecikmesi boyunca eski veri cache'e yazılmaz.
+#
+# İşaretler cache backend'inde tutulur. CACHE_BACKEND=memory ile her worker
+# yalnızca kendi gördüğü yazmaları bilir; başka worker'a düşen okuma replikaya
+# gidebilir. Çok worker'lı ve replikalı kurulumda read-your-writes için
+# CACHE_BACKEND=redis gerekir.
+
+GLOBAL_STICKY_KEY = "rw:global"
+sticky_reads = build_cache_backend()
+if async_replica_engine is not None and not sticky_reads.shared:
+    logger.warning(
+        "⚠️ DATABASE_REPLICA_URL paylaşımsız cache backend ile kullanılıyor: yazmadan sonraki "
+        "birincil okuma işaretleri worker başınadır, read-your-writes yalnızca aynı worker'da geçerlidir. "
+        "CACHE_BACKEND=redis önerilir."
+    )
+
+
+@event.listens_for(Session, "after_commit")
+def _flag_commit(session):
+    session.info["committed"] = True
+
+
+def _sticky_key(user_id: int) -> str:
+    return f"rw:user:{user_id}"
+
+
+async def mark_global_write() -> None:
+    await sticky_reads.set(GLOBAL_STICKY_KEY, b"1", DB_READ_STICKY_SECONDS)
+
+
+async def mark_recent_write(principal) -> None:
+    await sticky_reads.set(_sticky_key(principal.id), b"1", DB_READ_STICKY_SECONDS)
+    if principal.is_admin:
+        await mark_global_write()
+
+
+async def _read_from_primary(request: Request) -> bool:
+    if async_replica_engine is None:
+        return True
+    if await sticky_reads.get(GLOBAL_STICKY_KEY) is not None:
+        return True
+    principal = getattr(request.state, "principal", None)
+    return principal is not None and await sticky_reads.get(_sticky_key(principal.id)) is not None
+
+
+async def get_db(request: Request):
+    async with AsyncSessionLocal() as db:
+        yield db
+        if db.info.get("committed"):
+            principal = getattr(request.state, "principal", None)
+            if principal is not None:
+                await mark_recent_write(principal)
+
+
+async def get_read_db(request: Request):
+    """
+    Salt okunur route'lar için oturum: replika varsa ona, kullanıcı yakın
+    zamanda yazdıysa birincile bağlanır. Kimlik gerektiren route'larda
+    principal'ın önce çözülmesi için dependencies.get_principal_read_db kullanılır.
+    """
+    session_factory = AsyncSessionLocal if await _read_from_primary(request) else ReplicaSessionLocal
+    async with session_factory() as db:
         yield db
-    finally:
-        db.close()
\ No newline at end of file
@@ -1,45 +1,164 @@
-from fastapi import Depends, HTTPException, status
+import os
+from dataclasses import dataclass
+from typing import List, Optional
+
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from pydantic import ValidationError
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from jose import JWTError, jwt
 
-from database import get_db
-from models.user_model import UserModel
+from cache import build_cache_backend
+from database import get_db, get_read_db
+from models.user_model import UserModel, RoleEnum
 from schemas import TokenData
 from security import SECRET_KEY, ALGORITHM
 
 # 🔐 Swagger ve token doğrulama için Bearer şeması
 bearer_scheme = HTTPBearer(auto_error=False)
 
-# 🔑 Token'dan kullanıcıyı çıkaran fonksiyon
-def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
-    db: Session = Depends(get_db)
-) -> UserModel:
+# 🗂️ Kullanıcı başına güncel token sürümü (iptal kontrolü için TTL cache).
+# CACHE_BACKEND=redis ile tüm worker'lar aynı kaydı görür ve iptal anında
+# geçerlidir. memory backend'de her worker kendi kopyasını tutar: iptal eden
+# worker dışındakiler eski token'ı en fazla AUTH_STATE_TTL_SECONDS kabul eder,
+# bu yüzden varsayılan süre kısa tutulur.
+auth_state_cache = build_cache_backend()
+AUTH_STATE_TTL_SECONDS = int(os.getenv("AUTH_STATE_TTL_SECONDS", 300 if auth_state_cache.shared else 15))
+
+
+@dataclass(frozen=True)
+class Principal:
+    """İmzalı token claim'lerinden kurulan, veritabanına gitmeyen kimlik."""
+    id: int
+    role: RoleEnum
+    sectors: List[str]
+    token_version: int
+
+    @property
+    def is_admin(self) -> bool:
+        return self.role == RoleEnum.ADMIN
+
+
+def _token_version_key(user_id: int) -> str:
+    return f"auth:ver:{user_id}"
+
+
+async def remember_token_version(user_id: int, token_version: int) -> None:
+    await auth_state_cache.set(
+        _token_version_key(user_id), str(token_version).encode(), AUTH_STATE_TTL_SECONDS
+    )
+
+
+async def revoke_user_tokens(db: AsyncSession, user: UserModel) -> None:
+    """
+    Kullanıcının mevcut tüm token'larını geçersiz kılar ve bekleyen
+    değişikliklerle birlikte commit eder. Cache, commit başarılı olduktan
+    sonra güncellenir.
+    """
+    user.token_version = (user.token_version or 0) + 1
+    await db.commit()
+    await remember_token_version(user.id, user.token_version)
+
+
+async def _current_token_version(db: AsyncSession, user_id: int) -> Optional[int]:
+    cached = await auth_state_cache.get(_token_version_key(user_id))
+    if cached is not None:
+        return int(cached)
+
+    result = await db.execute(select(UserModel.token_version).where(UserModel.id == user_id))
+    token_version = result.scalar_one_or_none()
+    if token_version is not None:
+        await remember_token_version(user_id, token_version)
+    return token_version
+
+
+# 🔑 Token'dan kimliği çıkaran fonksiyon (cache isabetinde DB'ye gitmez)
+async def get_current_principal(
+    request: Request,
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme),
+    db: AsyncSession = Depends(get_db)
+) -> Principal:
     if not credentials or credentials.scheme.lower() != "bearer":
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Authorization header eksik veya 'Bearer <token>' formatında değil."
         )
 
-    token = credentials.credentials
-
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        user_id = int(payload.get("sub"))
-        if not user_id:
-            raise ValueError("sub alanı boş")
-    except (JWTError, ValueError):
+        payload = jwt.decode(credentials.credentials, SECRET_KEY, algorithms=[ALGORITHM])
+        claims = TokenData.model_validate(payload)
+        principal = Principal(
+            id=int(claims.sub),
+            role=RoleEnum(claims.role.value),
+            sectors=claims.sectors,
+            token_version=claims.ver,
+        )
+    except (JWTError, ValidationError, ValueError):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Token doğrulanamadı veya geçersiz payload."
         )
 
-    user = db.query(UserModel).filter(UserModel.id == user_id).first()
-    if not user:
+    current_version = await _current_token_version(db, principal.id)
+    if current_version is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Kullanıcı bulunamadı."
         )
+    if current_version != principal.token_version:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Oturum geçersiz kılındı. Lütfen tekrar giriş yapın."
+        )
+
+    request.state.principal = principal
+    return principal
+
+
+async def get_current_admin(
+    principal: Principal = Depends(get_current_principal)
+) -> Principal:
+    if not principal.is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Bu işlem için admin yetkisi gerekli."
+        )
+    return principal
+
+
+# 📖 Kimlik gerektiren salt okunur uçlar için replika oturumu
+async def get_principal_read_db(
+    request: Request,
+    principal: Principal = Depends(get_current_principal)
+):
+    """
+    Principal önce çözülür; böylece kullanıcının kendi yazmasından hemen sonraki
+    okumaları replika yerine birincil veritabanına yönlendirilir.
+    """
+    async for db in get_read_db(request):
+        yield db
+
+
+# 👤 Tam UserModel gereken uçlar için (profil, şifre vb.)
+def load_current_user(*options):
+    """
+    Principal'ın UserModel satırını verilen yükleme profiliyle getiren bir
+    dependency üretir. Profiller models/loaders.py içindedir.
+    """
+    async def dependency(
+        principal: Principal = Depends(get_current_principal),
+        db: AsyncSession = Depends(get_db)
+    ) -> UserModel:
+        user = await db.get(UserModel, principal.id, options=list(options))
+        if not user:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Kullanıcı bulunamadı."
+            )
+        return user
+
+    return dependency
+
 
-    return user
\ No newline at end of file
+get_current_user = load_current_user()
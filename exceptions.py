@@ -3,6 +3,8 @@ from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 from slowapi.errors import RateLimitExceeded
 
+from middlewares.pipeline import RequestBodyTooLarge, BODY_ERROR, RATE_LIMIT_ERROR, RATE_LIMITED
+
 def register_exception_handlers(app: FastAPI):
     
     @app.exception_handler(RequestValidationError)
@@ -29,12 +31,18 @@ def register_exception_handlers(app: FastAPI):
     
     @app.exception_handler(RateLimitExceeded)
     async def rate_limit_handler(request: Request, exc: RateLimitExceeded):
+        RATE_LIMITED.labels("route").inc()
         return JSONResponse(
             status_code=200,
-            content={
-                "success": False,
-                "message": "Çok fazla istek gönderildi. Lütfen biraz bekleyin."
-            }
+            content=RATE_LIMIT_ERROR
+        )
+
+    
+    @app.exception_handler(RequestBodyTooLarge)
+    async def body_too_large_handler(request: Request, exc: RequestBodyTooLarge):
+        return JSONResponse(
+            status_code=200,
+            content=BODY_ERROR
         )
 
     
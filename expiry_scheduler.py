@@ -0,0 +1,174 @@
+import asyncio
+import heapq
+import logging
+import os
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, List, Optional
+from uuid import UUID
+
+from dotenv import load_dotenv
+from sqlalchemy import select, update
+
+from database import AsyncSessionLocal, mark_global_write
+from metrics import Counter, Gauge
+from models.announcement_model import AnnouncementModel
+
+load_dotenv()
+
+logger = logging.getLogger("uvicorn.error")
+
+# -------------------------------
+# ⏰ Son başvuru tarihi zamanlayıcısı
+# -------------------------------
+# is_active, son başvuru tarihi geçtiği anda toplu bir UPDATE ile false
+# yapılır. Yakın ufuktaki tarihler bir min-heap'te tutulur; döngü en yakın
+# tarihe kadar uyur. Heap sadece uyanma zamanlarını belirler: hangi satırların
+# kapanacağına her seferinde veritabanı karar verir, bu yüzden birden fazla
+# worker aynı işi güvenle yapar (SKIP LOCKED). Periyodik yeniden eşitleme
+# diğer worker'ların yazmalarını ve kaçırılan tarihleri yakalar.
+
+EXPIRY_SCHEDULER_ENABLED = os.getenv("EXPIRY_SCHEDULER_ENABLED", "true").lower() == "true"
+EXPIRY_LOOKAHEAD_SECONDS = int(os.getenv("EXPIRY_LOOKAHEAD_SECONDS", 3600))
+EXPIRY_RESYNC_SECONDS = int(os.getenv("EXPIRY_RESYNC_SECONDS", 300))
+EXPIRY_BATCH_SIZE = int(os.getenv("EXPIRY_BATCH_SIZE", 1000))
+EXPIRY_HEAP_LIMIT = int(os.getenv("EXPIRY_HEAP_LIMIT", 10000))
+ERROR_BACKOFF_SECONDS = 5
+
+ExpiryHook = Callable[[List[UUID]], Awaitable[None]]
+
+EXPIRED = Counter("announcements_expired_total", "Zamanlayıcının pasife aldığı duyuru sayısı")
+
+
+def as_utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
+
+def is_open(deadline: datetime, now: Optional[datetime] = None) -> bool:
+    """Yazma anında is_active değerini belirler."""
+    return as_utc(deadline) > (now or datetime.now(timezone.utc))
+
+
+class ExpiryScheduler:
+    def __init__(self):
+        self._heap: List[datetime] = []
+        self._hooks: List[ExpiryHook] = []
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def add_hook(self, hook: ExpiryHook) -> None:
+        """Duyurular pasife alındığında çağrılır (ör. cache geçersiz kılma)."""
+        self._hooks.append(hook)
+
+    def schedule(self, deadline: datetime) -> None:
+        """Yeni ya da değişen bir son başvuru tarihini heap'e ekler."""
+        deadline = as_utc(deadline)
+        now = datetime.now(timezone.utc)
+        if deadline <= now or deadline > now + timedelta(seconds=EXPIRY_LOOKAHEAD_SECONDS):
+            return
+        if len(self._heap) >= EXPIRY_HEAP_LIMIT:
+            return  # yeniden eşitleme yakalar
+        heapq.heappush(self._heap, deadline)
+        if self._heap[0] == deadline:
+            self._wakeup.set()
+
+    def start(self) -> None:
+        if EXPIRY_SCHEDULER_ENABLED and self._task is None:
+            self._task = asyncio.create_task(self._run(), name="expiry-scheduler")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def resync(self) -> None:
+        """Heap'i veritabanındaki yakın tarihlerle yeniden kurar."""
+        horizon = datetime.now(timezone.utc) + timedelta(seconds=EXPIRY_LOOKAHEAD_SECONDS)
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                select(AnnouncementModel.application_deadline)
+                .where(AnnouncementModel.is_active, AnnouncementModel.application_deadline <= horizon)
+                .order_by(AnnouncementModel.application_deadline)
+                .limit(EXPIRY_HEAP_LIMIT)
+            )
+            # Sıralı liste zaten geçerli bir heap'tir
+            self._heap = list(result.scalars())
+
+    async def expire_due(self) -> List[UUID]:
+        now = datetime.now(timezone.utc)
+        due = False
+        while self._heap and self._heap[0] <= now:
+            heapq.heappop(self._heap)
+            due = True
+
+        expired = await self._expire(now)
+        if expired:
+            EXPIRED.inc(len(expired))
+            await mark_global_write()
+            logger.info(f"⏰ {len(expired)} duyurunun başvuru süresi doldu")
+        # Satırları başka bir worker kapatmış olsa da bu süreçteki cache'ler yenilenmeli
+        if expired or due:
+            await self._notify(expired)
+        return expired
+
+    async def _expire(self, now: datetime) -> List[UUID]:
+        expired: List[UUID] = []
+        async with AsyncSessionLocal() as db:
+            while True:
+                due = (
+                    select(AnnouncementModel.guid)
+                    .where(AnnouncementModel.is_active, AnnouncementModel.application_deadline <= now)
+                    .limit(EXPIRY_BATCH_SIZE)
+                    .with_for_update(skip_locked=True)
+                )
+                result = await db.execute(
+                    update(AnnouncementModel)
+                    .where(AnnouncementModel.guid.in_(due))
+                    .values(is_active=False)
+                    .returning(AnnouncementModel.guid)
+                    .execution_options(synchronize_session=False)
+                )
+                batch = list(result.scalars())
+                await db.commit()
+                expired.extend(batch)
+                if len(batch) < EXPIRY_BATCH_SIZE:
+                    return expired
+
+    async def _notify(self, expired: List[UUID]) -> None:
+        for hook in self._hooks:
+            try:
+                await hook(expired)
+            except Exception:
+                logger.exception("⚠️ Süre dolumu kancası hata verdi")
+
+    async def _run(self) -> None:
+        next_resync = 0.0
+        while True:
+            self._wakeup.clear()
+            try:
+                if time.monotonic() >= next_resync:
+                    next_resync = time.monotonic() + EXPIRY_RESYNC_SECONDS
+                    await self.resync()
+                await self.expire_due()
+            except Exception:
+                logger.exception("⚠️ Süre dolumu zamanlayıcısı hata verdi")
+                await asyncio.sleep(ERROR_BACKOFF_SECONDS)
+                continue
+
+            timeout = next_resync - time.monotonic()
+            if self._heap:
+                timeout = min(timeout, (self._heap[0] - datetime.now(timezone.utc)).total_seconds())
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=max(timeout, 0))
+            except asyncio.TimeoutError:
+                pass
+
+
+expiry_scheduler = ExpiryScheduler()
+
+Gauge("expiry_scheduler_pending", "Heap'te bekleyen son başvuru tarihi sayısı", lambda: len(expiry_scheduler._heap))
@@ -0,0 +1,213 @@
+import asyncio
+import logging
+import os
+from typing import List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from dotenv import load_dotenv
+from sqlalchemy import delete, func, not_, or_, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from database import AsyncSessionLocal, async_engine
+from expiry_scheduler import expiry_scheduler
+from metrics import counter_family
+from models.announcement_model import AnnouncementModel, user_feed
+from models.user_model import UserModel
+
+load_dotenv()
+
+logger = logging.getLogger("uvicorn.error")
+
+# -------------------------------
+# 📰 Kullanıcı feed'i (fan-out on write)
+# -------------------------------
+# user_feed, her kullanıcı için sektörleriyle eşleşen aktif duyuruları tutar.
+# Duyuru eklenince/sektörü ya da durumu değişince ve kullanıcının sektörleri
+# değişince aynı transaction içinde güncellenir; süresi dolan duyurular
+# zamanlayıcı kancasıyla çıkarılır. Böylece /by-sector okuması
+# (user_id, created_at, guid) indeksinde bir aralık taramasına iner.
+#
+# Arka plandaki eşitleme kullanıcıları id aralıklarıyla dolaşıp eksik satırları
+# ekler, fazlalıkları siler: ilk çalıştırmada mevcut veriyi doldurur (backfill),
+# sonrakilerde tutarlılık kontrolüdür. Onarılan her satır loglanır.
+
+FEED_SYNC_ON_STARTUP = os.getenv("FEED_SYNC_ON_STARTUP", "true").lower() == "true"
+# 0 ise periyodik kontrol kapalıdır
+FEED_SYNC_INTERVAL_SECONDS = int(os.getenv("FEED_SYNC_INTERVAL_SECONDS", 6 * 3600))
+FEED_SYNC_BATCH_USERS = int(os.getenv("FEED_SYNC_BATCH_USERS", 100))
+# Aynı anda tek worker'ın eşitleme yapması için advisory lock anahtarı
+FEED_SYNC_LOCK_KEY = 0x66656564
+
+FEED_REPAIRED = counter_family(
+    "user_feed_repaired_rows_total", "Eşitlemenin eklediği ya da sildiği feed satırları", ("kind",)
+)
+
+FEED_COLUMNS = [user_feed.c.user_id, user_feed.c.announcement_guid, user_feed.c.created_at]
+
+
+def _matches():
+    """Aktif ve kullanıcının sektörleriyle kesişen duyuru-kullanıcı çiftleri."""
+    return (
+        select(UserModel.id, AnnouncementModel.guid, AnnouncementModel.created_at)
+        .select_from(AnnouncementModel)
+        .join(UserModel, UserModel.sectors.overlap(AnnouncementModel.sectors))
+        .where(AnnouncementModel.is_active)
+    )
+
+
+def _insert(matches):
+    return pg_insert(user_feed).from_select(FEED_COLUMNS, matches).on_conflict_do_nothing()
+
+
+async def fan_out(db: AsyncSession, guids: Sequence[UUID]) -> None:
+    """Yeni duyuruları eşleşen kullanıcıların feed'ine ekler (satırlar flush edilmiş olmalı)."""
+    if guids:
+        await db.execute(_insert(_matches().where(AnnouncementModel.guid.in_(guids))))
+
+
+async def refresh_announcements(db: AsyncSession, guids: Sequence[UUID]) -> None:
+    """Sektörü ya da durumu değişen duyuruların feed satırlarını yeniden kurar."""
+    if guids:
+        await db.execute(delete(user_feed).where(user_feed.c.announcement_guid.in_(guids)))
+        await fan_out(db, guids)
+
+
+async def refresh_user(db: AsyncSession, user_id: int, sectors: List[str]) -> None:
+    """Sektörleri değişen kullanıcının feed'ini yeniden kurar."""
+    await db.execute(delete(user_feed).where(user_feed.c.user_id == user_id))
+    if sectors:
+        await db.execute(_insert(
+            select(UserModel.id, AnnouncementModel.guid, AnnouncementModel.created_at)
+            .select_from(AnnouncementModel)
+            .join(UserModel, UserModel.id == user_id)
+            .where(AnnouncementModel.is_active, AnnouncementModel.sectors.overlap(sectors))
+        ))
+
+
+async def _remove_expired(guids: List[UUID]) -> None:
+    if not guids:
+        return
+    async with AsyncSessionLocal() as db:
+        await db.execute(delete(user_feed).where(user_feed.c.announcement_guid.in_(guids)))
+        await db.commit()
+
+
+expiry_scheduler.add_hook(_remove_expired)
+
+
+# -------------------------------
+# 🔁 Backfill ve tutarlılık kontrolü
+# -------------------------------
+
+async def _sync_range(conn: AsyncConnection, first_id: int, last_id: int) -> Tuple[int, int]:
+    # Büyük aralıklar DB_STATEMENT_TIMEOUT_MS'i aşabilir; sadece bu transaction için kapatılır
+    await conn.execute(text("SET LOCAL statement_timeout = 0"))
+    inserted = await conn.execute(
+        _insert(_matches().where(UserModel.id.between(first_id, last_id))).returning(user_feed.c.user_id)
+    )
+    inserted_count = len(inserted.all())
+
+    # DELETE ... USING users, announcements: artık eşleşmeyen ya da pasif duyurular
+    deleted = await conn.execute(
+        delete(user_feed)
+        .where(
+            user_feed.c.user_id.between(first_id, last_id),
+            user_feed.c.user_id == UserModel.id,
+            user_feed.c.announcement_guid == AnnouncementModel.guid,
+            or_(not_(AnnouncementModel.is_active), not_(UserModel.sectors.overlap(AnnouncementModel.sectors)))
+        )
+        .returning(user_feed.c.user_id)
+    )
+    deleted_count = len(deleted.all())
+    await conn.commit()
+    return inserted_count, deleted_count
+
+
+async def sync_feeds() -> Optional[Tuple[int, int]]:
+    """
+    Tüm kullanıcıların feed'ini id aralıklarıyla eşitler; (eklenen, silinen)
+    döner. Başka bir worker eşitleme yapıyorsa None döner.
+    """
+    async with async_engine.connect() as conn:
+        locked = await conn.scalar(select(func.pg_try_advisory_lock(FEED_SYNC_LOCK_KEY)))
+        await conn.commit()
+        if not locked:
+            return None
+        try:
+            inserted = deleted = 0
+            last_id = 0
+            while True:
+                ids = (await conn.execute(
+                    select(UserModel.id).where(UserModel.id > last_id)
+                    .order_by(UserModel.id).limit(FEED_SYNC_BATCH_USERS)
+                )).scalars().all()
+                if not ids:
+                    break
+                added, removed = await _sync_range(conn, ids[0], ids[-1])
+                inserted += added
+                deleted += removed
+                last_id = ids[-1]
+            return inserted, deleted
+        finally:
+            # Oturum seviyesindeki kilit bırakılamazsa bağlantı havuza kilitli dönmemeli
+            try:
+                await conn.rollback()
+                await conn.execute(select(func.pg_advisory_unlock(FEED_SYNC_LOCK_KEY)))
+                await conn.commit()
+            except Exception:
+                await conn.invalidate()
+                raise
+
+
+class FeedSynchronizer:
+    """Açılışta backfill, ardından periyodik tutarlılık kontrolü yapan arka plan görevi."""
+
+    def __init__(self):
+        self._task: Optional[asyncio.Task] = None
+        self._first_run = True
+
+    def start(self) -> None:
+        if self._task is None and (FEED_SYNC_ON_STARTUP or FEED_SYNC_INTERVAL_SECONDS):
+            self._task = asyncio.create_task(self._run(), name="feed-sync")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        if not FEED_SYNC_ON_STARTUP:
+            await asyncio.sleep(FEED_SYNC_INTERVAL_SECONDS)
+        while True:
+            try:
+                result = await sync_feeds()
+                self._report(result)
+            except Exception:
+                logger.exception("⚠️ Feed eşitlemesi hata verdi")
+            if not FEED_SYNC_INTERVAL_SECONDS:
+                return
+            await asyncio.sleep(FEED_SYNC_INTERVAL_SECONDS)
+
+    def _report(self, result: Optional[Tuple[int, int]]) -> None:
+        if result is None:
+            return
+        inserted, deleted = result
+        FEED_REPAIRED.labels("inserted").inc(inserted)
+        FEED_REPAIRED.labels("deleted").inc(deleted)
+        first_run, self._first_run = self._first_run, False
+        if not (inserted or deleted):
+            logger.info("📰 Feed eşitlemesi: tutarsızlık yok")
+        elif first_run:
+            # İlk çalıştırma backfill'dir; eksik satırlar beklenir
+            logger.info(f"📰 Feed eşitlemesi: {inserted} satır eklendi, {deleted} satır silindi")
+        else:
+            logger.warning(f"⚠️ Feed tutarsızlığı onarıldı: {inserted} eksik satır eklendi, {deleted} fazla satır silindi")
+
+
+feed_synchronizer = FeedSynchronizer()
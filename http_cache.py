@@ -0,0 +1,87 @@
+import hashlib
+import os
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Dict, Iterable, Optional
+
+from fastapi import Request
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+CACHE_CONTROL_MAX_AGE = int(os.getenv("CACHE_CONTROL_MAX_AGE", 30))
+CACHE_CONTROL_STALE_WHILE_REVALIDATE = int(os.getenv("CACHE_CONTROL_STALE_WHILE_REVALIDATE", 60))
+
+
+def make_etag(*parts: str) -> str:
+    digest = hashlib.sha1(":".join(parts).encode()).hexdigest()[:24]
+    return f'"{digest}"'
+
+
+# Sıkıştırılmış temsiller aynı içeriğin farklı baytlarıdır; güçlü ETag'leri
+# kodlama son ekiyle ayrılır, koşullu isteklerde son ek yok sayılır
+ENCODING_SUFFIXES = ("-br", "-gzip")
+
+
+def variant_etag(etag: str, encoding: str) -> str:
+    if not etag.endswith('"'):
+        return etag
+    return f'{etag[:-1]}-{encoding}"'
+
+
+def _base_etag(tag: str) -> str:
+    for suffix in ENCODING_SUFFIXES:
+        if tag.endswith(suffix + '"'):
+            return tag[:-len(suffix) - 1] + '"'
+    return tag
+
+
+def http_date(version_ns: int) -> str:
+    return formatdate(version_ns / 1_000_000_000, usegmt=True)
+
+
+def not_modified_etag(request: Request, etag: str, version_ns: Optional[int] = None) -> Optional[str]:
+    """
+    Koşullu GET kontrolü; 304 dönülecekse yanıtta gönderilecek ETag'i döner.
+    İstemci bir kodlama varyantı (-gzip/-br) gönderdiyse 304 aynı varyantı
+    taşır. If-None-Match varsa If-Modified-Since yok sayılır (RFC 9110 13.2.2);
+    version_ns verilmezse If-Modified-Since hiç kullanılmaz.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        for tag in if_none_match.split(","):
+            tag = tag.strip().removeprefix("W/")
+            if tag == "*":
+                return etag
+            if _base_etag(tag) == etag:
+                return tag
+        return None
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and version_ns is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return None
+        if version_ns // 1_000_000_000 <= int(since.timestamp()):
+            return etag
+
+    return None
+
+
+def public_cache_headers(
+    etag: str,
+    version_ns: Optional[int],
+    surrogate_keys: Iterable[str],
+    max_age: Optional[int] = None,
+) -> Dict[str, str]:
+    max_age = CACHE_CONTROL_MAX_AGE if max_age is None else max_age
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={max_age}, stale-while-revalidate={CACHE_CONTROL_STALE_WHILE_REVALIDATE}",
+        "Surrogate-Key": " ".join(surrogate_keys),
+        "Vary": "Accept-Encoding",
+    }
+    if version_ns is not None:
+        headers["Last-Modified"] = http_date(version_ns)
+    return headers
@@ -2,24 +2,29 @@ import os
 import logging
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, Request
+import anyio.to_thread
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
 from fastapi.routing import APIRoute
 from fastapi.openapi.utils import get_openapi
 from fastapi.staticfiles import StaticFiles
-from starlette.middleware.base import BaseHTTPMiddleware
 
 from dotenv import load_dotenv
-from slowapi import Limiter
-from slowapi.util import get_remote_address
-from slowapi.middleware import SlowAPIMiddleware
 
-from database import Base, engine
+from database import Base, engine, async_engine, async_replica_engine
+from expiry_scheduler import expiry_scheduler
+from feed import feed_synchronizer
+from metrics import Gauge, render_prometheus
+from passwords import password_pool
 from exceptions import register_exception_handlers
+from middlewares.compression import CompressionMiddleware
+from middlewares.pipeline import RequestPipelineMiddleware
+from middlewares.url_policy import get_url_policy
+from rate_limit import limiter, RATE_LIMIT_DEFAULT
 from auth import router as auth_router, create_admin_if_not_exists
 from users import router as users_router
-from announcement_router import router as announcements_router
+from announcement_router import router as announcements_router, IMPORT_PATH
 from sector_router import router as sectors_router
 
 load_dotenv()
@@ -27,49 +32,34 @@ ENV = os.getenv("ENV", "development")
 DEBUG = ENV == "development"
 PORT = int(os.getenv("PORT", 8000))
 MAX_BODY_SIZE_MB = int(os.getenv("MAX_BODY_SIZE_MB", 1))
+IMPORT_MAX_BODY_SIZE_MB = int(os.getenv("IMPORT_MAX_BODY_SIZE_MB", 200))
 
 logger = logging.getLogger("uvicorn.error")
 logger.setLevel(logging.DEBUG)
 logging.basicConfig(level=logging.DEBUG if DEBUG else logging.INFO)
 
-class SuspiciousURLBlockerMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        url_path = request.url.path
-        url_str = str(request.url)
-
-        if url_path.startswith(("/docs", "/redoc", "/openapi.json", "/favicon.ico")):
-            return await call_next(request)
-
-        if any(char in url_str for char in ["?", "&", "<", ">", "script"]):
-            return JSONResponse(
-                status_code=400,
-                content={"success": False, "error": "Geçersiz veya güvenli olmayan bağlantı."}
-            )
-
-        return await call_next(request)
-
-class BodySizeLimitMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        max_body_size = MAX_BODY_SIZE_MB * 1024 * 1024
-        content_length = request.headers.get("content-length")
-        if content_length and int(content_length) > max_body_size:
-            return JSONResponse(
-                status_code=200,
-                content={"success": False, "error": "İstek boyutu çok büyük."}
-            )
-        return await call_next(request)
-
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("🔄 Uygulama başlatılıyor…")
+    # Route başına izinli query parametreleri route tablosundan derlenir
+    policy = get_url_policy(app)
+    logger.info(f"🛡️ URL politikası derlendi: {len(policy.static) + len(policy.dynamic)} route")
     if DEBUG:
         Base.metadata.create_all(bind=engine)
         create_admin_if_not_exists()
+    # Son başvuru tarihi geçen duyuruları tam zamanında pasife alır
+    expiry_scheduler.start()
+    # Mevcut veri için feed backfill'i ve periyodik tutarlılık kontrolü
+    feed_synchronizer.start()
     yield
+    await feed_synchronizer.stop()
+    await expiry_scheduler.stop()
+    await async_engine.dispose()
+    if async_replica_engine is not None:
+        await async_replica_engine.dispose()
+    password_pool.shutdown()
     logger.info("🛑 Uygulama kapatılıyor…")
 
-limiter = Limiter(key_func=get_remote_address)
-
 app = FastAPI(
     title="Announcement API",
     version="1.0.0",
@@ -80,9 +70,17 @@ app = FastAPI(
 )
 app.state.limiter = limiter
 
-app.add_middleware(SuspiciousURLBlockerMiddleware)
-app.add_middleware(BodySizeLimitMiddleware)
-app.add_middleware(SlowAPIMiddleware)
+# URL politikası, global rate limit ve gövde sınırı tek bir saf ASGI katmanında
+app.add_middleware(
+    RequestPipelineMiddleware,
+    limiter=limiter,
+    max_body_size=MAX_BODY_SIZE_MB * 1024 * 1024,
+    default_limit=RATE_LIMIT_DEFAULT or None,
+    body_size_overrides={IMPORT_PATH: IMPORT_MAX_BODY_SIZE_MB * 1024 * 1024},
+)
+
+# Pipeline'ın dışında: hata yanıtları dahil tek parça JSON gövdeleri sıkıştırılır
+app.add_middleware(CompressionMiddleware)
 
 app.add_middleware(
     CORSMiddleware,
@@ -90,6 +88,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Access-Token"],
 )
 
 register_exception_handlers(app)
@@ -107,6 +106,18 @@ async def health_check():
         "env": ENV,
     }
 
+def _threadpool_stats():
+    # anyio'nun varsayılan thread limiter'ı event loop başınadır; /metrics
+    # handler'ı loop üzerinde çalıştığı için burada okunabilir
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    return {("total",): float(limiter.total_tokens), ("in_use",): float(limiter.borrowed_tokens)}
+
+Gauge("threadpool_tokens", "Varsayılan threadpool kapasitesi ve kullanımı", _threadpool_stats, ("state",))
+
+@app.get("/metrics", tags=["Health"], include_in_schema=False)
+async def prometheus_metrics():
+    return PlainTextResponse(render_prometheus(), media_type="text/plain; version=0.0.4")
+
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
 def custom_openapi():
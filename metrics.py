@@ -0,0 +1,178 @@
+import bisect
+from typing import Callable, Dict, Iterator, List, Sequence, Tuple, Union
+
+# -------------------------------
+# 📈 Hafif metrik tipleri
+# -------------------------------
+# Sıcak yolda kilit kullanılmaz: gözlemler event loop üzerinde ya da tek bir
+# sayaç artışı olarak yapılır; küçük yarış kayıpları metrik için kabul edilir.
+# Oluşturulan her metrik REGISTRY'ye eklenir ve /metrics üzerinden Prometheus
+# metin formatında yayınlanır.
+
+DEFAULT_LATENCY_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+DEFAULT_SIZE_BUCKETS = (
+    256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304
+)
+
+Labels = Tuple[Tuple[str, str], ...]
+Sample = Tuple[str, Labels, float]
+
+REGISTRY: List["Metric"] = []
+
+
+class Metric:
+    type = "untyped"
+
+    def __init__(self, name: str, documentation: str, register: bool = True):
+        self.name = name
+        self.documentation = documentation
+        if register:
+            REGISTRY.append(self)
+
+    def samples(self, labels: Labels = ()) -> Iterator[Sample]:
+        raise NotImplementedError
+
+
+class Histogram(Metric):
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+        register: bool = True,
+    ):
+        super().__init__(name, documentation, register)
+        self.buckets: List[float] = sorted(buckets)
+        self.counts: List[int] = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def snapshot(self) -> Dict[str, object]:
+        cumulative, running = [], 0
+        for count in self.counts:
+            running += count
+            cumulative.append(running)
+        return {"buckets": self.buckets, "cumulative": cumulative, "sum": self.sum, "count": self.count}
+
+    def samples(self, labels: Labels = ()) -> Iterator[Sample]:
+        snapshot = self.snapshot()
+        for bound, cumulative in zip([*self.buckets, float("inf")], snapshot["cumulative"]):
+            yield f"{self.name}_bucket", labels + (("le", _format_value(bound)),), cumulative
+        yield f"{self.name}_sum", labels, self.sum
+        yield f"{self.name}_count", labels, self.count
+
+
+class Counter(Metric):
+    type = "counter"
+
+    def __init__(self, name: str, documentation: str, register: bool = True):
+        super().__init__(name, documentation, register)
+        self.value = 0
+
+    def inc(self, amount: int = 1) -> None:
+        self.value += amount
+
+    def samples(self, labels: Labels = ()) -> Iterator[Sample]:
+        yield self.name, labels, self.value
+
+
+class Gauge(Metric):
+    """
+    Değeri okunma anında hesaplanan gösterge. Fonksiyon tek bir sayı ya da
+    etiket değerleri -> sayı sözlüğü döndürebilir.
+    """
+
+    type = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        fn: Callable[[], Union[float, Dict[Tuple[str, ...], float]]],
+        labelnames: Sequence[str] = (),
+        register: bool = True,
+    ):
+        super().__init__(name, documentation, register)
+        self.fn = fn
+        self.labelnames = tuple(labelnames)
+
+    def samples(self, labels: Labels = ()) -> Iterator[Sample]:
+        value = self.fn()
+        if isinstance(value, dict):
+            for values, item in value.items():
+                yield self.name, labels + tuple(zip(self.labelnames, values)), item
+        else:
+            yield self.name, labels, value
+
+
+class MetricFamily(Metric):
+    """
+    Etiketli metrik ailesi; her etiket kombinasyonu için kayıtsız bir alt metrik
+    tutar. labels() sıcak yolda tek bir sözlük araması yapar.
+    """
+
+    def __init__(self, child: Callable[[], Metric], name: str, documentation: str, labelnames: Sequence[str]):
+        super().__init__(name, documentation)
+        self.type = child().type
+        self._child = child
+        self.labelnames = tuple(labelnames)
+        self.children: Dict[Tuple[str, ...], Metric] = {}
+
+    def labels(self, *values: str):
+        metric = self.children.get(values)
+        if metric is None:
+            metric = self.children.setdefault(values, self._child())
+        return metric
+
+    def samples(self, labels: Labels = ()) -> Iterator[Sample]:
+        for values, metric in list(self.children.items()):
+            yield from metric.samples(labels + tuple(zip(self.labelnames, values)))
+
+
+def histogram_family(
+    name: str, documentation: str, labelnames: Sequence[str], buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS
+) -> MetricFamily:
+    return MetricFamily(lambda: Histogram(name, documentation, buckets, register=False), name, documentation, labelnames)
+
+
+def counter_family(name: str, documentation: str, labelnames: Sequence[str]) -> MetricFamily:
+    return MetricFamily(lambda: Counter(name, documentation, register=False), name, documentation, labelnames)
+
+
+# -------------------------------
+# 📤 Prometheus metin formatı
+# -------------------------------
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def render_prometheus() -> str:
+    lines: List[str] = []
+    for metric in REGISTRY:
+        lines.append(f"# HELP {metric.name} {_escape(metric.documentation)}")
+        lines.append(f"# TYPE {metric.name} {metric.type}")
+        for name, labels, value in metric.samples():
+            if labels:
+                rendered = ",".join(f'{key}="{_escape(str(item))}"' for key, item in labels)
+                lines.append(f"{name}{{{rendered}}} {_format_value(value)}")
+            else:
+                lines.append(f"{name} {_format_value(value)}")
+    return "\n".join(lines) + "\n"
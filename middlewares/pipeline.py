@@ -0,0 +1,172 @@
+import time
+from typing import Dict, Optional
+
+from fastapi import HTTPException, status
+from fastapi.responses import JSONResponse
+from limits import parse as parse_limit
+from slowapi import Limiter
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from metrics import DEFAULT_SIZE_BUCKETS, counter_family, histogram_family
+from middlewares.url_policy import get_url_policy
+from sql_instrumentation import SERVER_TIMING_ENABLED, report, track_queries
+
+URL_ERROR = {"success": False, "error": "Geçersiz veya güvenli olmayan bağlantı."}
+BODY_ERROR = {"success": False, "error": "İstek boyutu çok büyük."}
+RATE_LIMIT_ERROR = {"success": False, "message": "Çok fazla istek gönderildi. Lütfen biraz bekleyin."}
+
+
+# Route etiketi path şablonudur (ör. /announcements/{announcement_guid});
+# eşleşmeyen istekler tek bir etikette toplanır, böylece kardinalite sınırlı kalır
+UNMATCHED_ROUTE = "unmatched"
+
+REQUEST_DURATION = histogram_family(
+    "http_request_duration_seconds", "Route bazlı istek süresi", ("method", "route")
+)
+REQUESTS = counter_family(
+    "http_requests_total", "Route ve durum koduna göre istek sayısı", ("method", "route", "status")
+)
+RESPONSE_SIZE = histogram_family(
+    "http_response_size_bytes", "Sıkıştırma öncesi yanıt gövdesi boyutu", ("route",), DEFAULT_SIZE_BUCKETS
+)
+RATE_LIMITED = counter_family(
+    "rate_limit_rejected_total", "Rate limit nedeniyle reddedilen istekler", ("limit",)
+)
+
+
+class RequestBodyTooLarge(HTTPException):
+    """
+    Gövde akış halinde okunurken sınır aşıldığında fırlatılır. HTTPException
+    olduğu için FastAPI gövde ayrıştırması onu 400'e çevirmeden iletir.
+    """
+
+    def __init__(self):
+        super().__init__(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=BODY_ERROR["error"])
+
+
+class RequestPipelineMiddleware:
+    """
+    Saf ASGI tek geçişli istek hattı: route bazlı URL/query politikası, global rate limit ve
+    gövde boyutu sınırı aynı katmanda uygulanır; route bazlı süre, durum ve
+    yanıt boyutu metrikleri de burada kaydedilir. BaseHTTPMiddleware'in
+    görev/akış sarmalama maliyeti yoktur; gövdesiz isteklerde receive/send
+    hiç sarılmaz.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        limiter: Limiter,
+        max_body_size: int,
+        default_limit: Optional[str] = None,
+        body_size_overrides: Optional[Dict[str, int]] = None,
+    ):
+        self.app = app
+        self.limiter = limiter
+        self.max_body_size = max_body_size
+        # Toplu içe aktarım gibi büyük gövde bekleyen path'ler için ayrı sınır
+        self.body_size_overrides = body_size_overrides or {}
+        self.default_limit = parse_limit(default_limit) if default_limit else None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status_code = 500
+        size = 0
+
+        async def metered_send(message: Message) -> None:
+            nonlocal status_code, size
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if SERVER_TIMING_ENABLED:
+                    elapsed = (time.perf_counter() - started) * 1000
+                    MutableHeaders(raw=message.setdefault("headers", [])).append(
+                        "Server-Timing", f"{stats.server_timing()}, app;dur={elapsed:.1f}"
+                    )
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        try:
+            # İstek boyunca çalışan sorgular sayılır (Server-Timing, N+1, sorgu bütçesi)
+            with track_queries() as stats:
+                await self._handle(scope, receive, metered_send)
+        finally:
+            report(stats, scope["method"], scope["path"])
+            # Router eşleşen route'u aynı scope sözlüğüne yazar
+            route = getattr(scope.get("route"), "path_format", UNMATCHED_ROUTE)
+            REQUEST_DURATION.labels(scope["method"], route).observe(time.perf_counter() - started)
+            REQUESTS.labels(scope["method"], route, str(status_code)).inc()
+            RESPONSE_SIZE.labels(route).observe(size)
+
+    async def _handle(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # Politika route tablosundan derlenir; lifespan'de önceden ısıtılır
+        policy = get_url_policy(scope["app"])
+        if not policy.allows(scope["path"], scope["query_string"]):
+            await JSONResponse(status_code=400, content=URL_ERROR)(scope, receive, send)
+            return
+
+        if self.default_limit is not None and self.limiter.enabled and not self._hit_default_limit(scope):
+            RATE_LIMITED.labels("global").inc()
+            await JSONResponse(status_code=200, content=RATE_LIMIT_ERROR)(scope, receive, send)
+            return
+
+        has_body, content_length = self._body_headers(scope)
+        if not has_body:
+            await self.app(scope, receive, send)
+            return
+
+        max_body_size = self.body_size_overrides.get(scope["path"], self.max_body_size)
+        if content_length is not None and content_length > max_body_size:
+            await JSONResponse(status_code=200, content=BODY_ERROR)(scope, receive, send)
+            return
+
+        # Content-Length'e güvenmeden gerçekten alınan baytlar sayılır
+        received = 0
+        response_started = False
+
+        async def limited_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > max_body_size:
+                    raise RequestBodyTooLarge()
+            return message
+
+        async def tracked_send(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, limited_receive, tracked_send)
+        except RequestBodyTooLarge:
+            if response_started:
+                raise
+            await JSONResponse(status_code=200, content=BODY_ERROR)(scope, receive, send)
+
+    def _hit_default_limit(self, scope: Scope) -> bool:
+        client = scope.get("client")
+        key = client[0] if client else "127.0.0.1"
+        return self.limiter.limiter.hit(self.default_limit, key, "global")
+
+    @staticmethod
+    def _body_headers(scope: Scope):
+        has_body = False
+        content_length = None
+        for name, value in scope["headers"]:
+            if name == b"content-length":
+                try:
+                    content_length = int(value)
+                except ValueError:
+                    content_length = None
+                has_body = content_length != 0
+            elif name == b"transfer-encoding":
+                has_body = True
+        return has_body, content_length
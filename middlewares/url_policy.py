@@ -0,0 +1,96 @@
+import re
+from typing import Dict, FrozenSet, Iterable, List, Optional, Pattern, Set, Tuple
+from urllib.parse import unquote_plus
+
+from fastapi.dependencies.models import Dependant
+from fastapi.routing import APIRoute
+
+# Dokümantasyon, statik dosyalar ve ikon URL politikasından muaftır
+EXEMPT_PREFIXES = ("/docs", "/redoc", "/openapi.json", "/favicon.ico", "/static")
+
+# Tek geçişte taranan şüpheli parçalar. Path ASGI tarafından çözülmüş gelir;
+# query string ham bayttır, bu yüzden yüzde kodlu < > da yakalanır. Query
+# değerlerinde kelime araması yapılmaz: fields=description ya da q=javascript
+# meşru isteklerdir; değerler route'un kendi doğrulamasından geçer.
+SUSPICIOUS_PATH = re.compile(r"[<>&]|script", re.IGNORECASE)
+SUSPICIOUS_QUERY = re.compile(rb"[<>]|%3[ce]", re.IGNORECASE)
+
+NO_PARAMS: FrozenSet[str] = frozenset()
+
+
+def _query_params(dependant: Dependant) -> Set[str]:
+    """Route'un ve alt bağımlılıklarının tanımladığı query parametre adları."""
+    params = {param.alias for param in dependant.query_params}
+    for sub_dependant in dependant.dependencies:
+        params |= _query_params(sub_dependant)
+    return params
+
+
+class URLPolicy:
+    """
+    Route tablosundan derlenen, route başına izinli query parametreleri.
+    Sabit path'ler sözlükten, path parametreli route'lar derlenmiş regex'ten
+    eşlenir; route'ta tanımlı olmayan bir parametre gelirse istek reddedilir.
+    """
+
+    def __init__(self, static: Dict[str, FrozenSet[str]], dynamic: List[Tuple[Pattern, FrozenSet[str]]]):
+        self.static = static
+        self.dynamic = dynamic
+
+    @classmethod
+    def from_routes(cls, routes: Iterable) -> "URLPolicy":
+        static: Dict[str, set] = {}
+        dynamic: Dict[str, Tuple[Pattern, set]] = {}
+        for route in routes:
+            if not isinstance(route, APIRoute):
+                continue
+            params = _query_params(route.dependant)
+            if "{" in route.path_format:
+                dynamic.setdefault(route.path_format, (route.path_regex, set()))[1].update(params)
+            else:
+                static.setdefault(route.path_format, set()).update(params)
+        return cls(
+            {path: frozenset(params) for path, params in static.items()},
+            [(regex, frozenset(params)) for regex, params in dynamic.values()],
+        )
+
+    def allowed_params(self, path: str) -> FrozenSet[str]:
+        params = self.static.get(path)
+        if params is not None:
+            return params
+        for regex, params in self.dynamic:
+            if regex.match(path):
+                return params
+        return NO_PARAMS
+
+    def allows(self, path: str, query_string: bytes) -> bool:
+        if path.startswith(EXEMPT_PREFIXES):
+            return True
+        if SUSPICIOUS_PATH.search(path):
+            return False
+        if not query_string:
+            return True
+        if SUSPICIOUS_QUERY.search(query_string):
+            return False
+
+        allowed = self.allowed_params(path)
+        if not allowed:
+            return False
+        for pair in query_string.split(b"&"):
+            if not pair:
+                continue
+            name = pair.split(b"=", 1)[0].decode("latin-1")
+            if "%" in name or "+" in name:
+                name = unquote_plus(name)
+            if name not in allowed:
+                return False
+        return True
+
+
+def get_url_policy(app) -> URLPolicy:
+    """Politikayı ilk çağrıda derleyip app.state üzerinde saklar."""
+    policy: Optional[URLPolicy] = getattr(app.state, "url_policy", None)
+    if policy is None:
+        policy = URLPolicy.from_routes(app.routes)
+        app.state.url_policy = policy
+    return policy
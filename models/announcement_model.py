@@ -7,19 +7,41 @@ from sqlalchemy import (
     DateTime,
     Table,
     ForeignKey,
-    func
+    Index,
+    Computed,
+    func,
+    text
 )
-from sqlalchemy.dialects.postgresql import UUID, ARRAY
-from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import UUID, ARRAY, TSVECTOR
+from sqlalchemy.orm import relationship, deferred
 import uuid
 
 from database import Base
 
+# Tam metin arama için PostgreSQL metin yapılandırması
+SEARCH_CONFIG = "turkish"
+
 saved_announcements = Table(
     "saved_announcements",
     Base.metadata,
     Column("user_id", ForeignKey("users.id", ondelete="CASCADE"), primary_key=True),
-    Column("announcement_guid", UUID(as_uuid=True), ForeignKey("announcements.guid", ondelete="CASCADE"), primary_key=True)
+    Column("announcement_guid", UUID(as_uuid=True), ForeignKey("announcements.guid", ondelete="CASCADE"), primary_key=True),
+    Column("saved_at", DateTime(timezone=True), server_default=func.now(), nullable=False),
+    # Kullanıcının kaydettikleri listesi için sıralı indeks (keyset sayfalama)
+    Index("ix_saved_announcements_user_saved_at", "user_id", "saved_at", "announcement_guid")
+)
+
+# Kullanıcının sektörleriyle eşleşen aktif duyurular; yazma anında doldurulur (feed.py)
+user_feed = Table(
+    "user_feed",
+    Base.metadata,
+    Column("user_id", ForeignKey("users.id", ondelete="CASCADE"), primary_key=True),
+    Column("announcement_guid", UUID(as_uuid=True), ForeignKey("announcements.guid", ondelete="CASCADE"), primary_key=True),
+    # Duyurunun created_at değeri; sıralama join olmadan indeksten yapılır
+    Column("created_at", DateTime(timezone=True), nullable=False),
+    Index("ix_user_feed_user_created_at", "user_id", "created_at", "announcement_guid"),
+    # Duyuru bazlı silme (sektör değişikliği, süre dolumu) için
+    Index("ix_user_feed_announcement_guid", "announcement_guid")
 )
 
 class AnnouncementModel(Base):
@@ -44,9 +66,38 @@ class AnnouncementModel(Base):
     budget_support = Column(String, nullable=False, default="")
     application_language = Column(String, nullable=False, default="")
 
+    # Başlık (A) açıklamadan (B) daha ağır; veritabanı tarafından üretilir ve
+    # yanıtlarda kullanılmadığı için varsayılan SELECT'e dahil edilmez
+    search_vector = deferred(
+        Column(
+            TSVECTOR,
+            Computed(
+                f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(title, '')), 'A') || "
+                f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(description, '')), 'B')",
+                persisted=True
+            )
+        ),
+        raiseload=True
+    )
+
     saved_by_users = relationship(
         "UserModel",
         secondary=saved_announcements,
         back_populates="saved_announcements",
-        lazy="joined"
+        lazy="raise",
+        passive_deletes=True
+    )
+
+    # Keyset sayfalama için (created_at, guid) sıralı indeks
+    __table_args__ = (
+        Index("ix_announcements_created_at_guid", "created_at", "guid"),
+        # Sektör eşleşmesi (&& operatörü) için GIN indeks
+        Index("ix_announcements_sectors_gin", "sectors", postgresql_using="gin"),
+        # Tam metin arama (@@ operatörü) için GIN indeks
+        Index("ix_announcements_search_vector_gin", "search_vector", postgresql_using="gin"),
+        # /active ve /passive keyset sayfalaması için kısmi indeksler
+        Index("ix_announcements_active_created_at", "created_at", "guid", postgresql_where=text("is_active")),
+        Index("ix_announcements_passive_created_at", "created_at", "guid", postgresql_where=text("NOT is_active")),
+        # Zamanlayıcının süresi dolan aktif duyuruları bulması için
+        Index("ix_announcements_active_deadline", "application_deadline", postgresql_where=text("is_active")),
     )
\ No newline at end of file
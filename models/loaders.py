@@ -0,0 +1,25 @@
+# models/loaders.py
+# 📋 Uç bazlı ilişki yükleme profilleri.
+# Modellerdeki tüm ilişkiler lazy="raise" tanımlıdır; bir ilişkiye ihtiyaç
+# duyan sorgu, aşağıdaki profillerden birini açıkça .options(*PROFIL) ile seçer.
+
+from sqlalchemy.orm import load_only, selectinload
+
+from models.announcement_model import AnnouncementModel
+from models.user_model import UserModel
+
+# UserResponse: kaydedilen duyurular yalnızca AnnouncementSummary alanlarıyla
+USER_PROFILE = (
+    selectinload(UserModel.saved_announcements).options(
+        load_only(
+            AnnouncementModel.guid,
+            AnnouncementModel.title,
+            AnnouncementModel.application_deadline,
+        )
+    ),
+)
+
+# Giriş ve admin bootstrap: şifre kaydı
+USER_WITH_PASSWORD = (
+    selectinload(UserModel.password_entry),
+)
@@ -8,6 +8,7 @@ from sqlalchemy import (
     DateTime,
     Enum as SqlEnum,
     ForeignKey,
+    Index,
     func
 )
 from sqlalchemy.dialects.postgresql import ARRAY
@@ -36,18 +37,29 @@ class UserModel(Base):
     profession = Column(String(100), nullable=False, default="")
     sectors = Column(ARRAY(String), nullable=False, default=[])
 
+    # Artırıldığında kullanıcının mevcut tüm token'ları geçersiz olur
+    token_version = Column(Integer, nullable=False, default=0, server_default="0")
+
     saved_announcements = relationship(
         "AnnouncementModel",
         secondary=saved_announcements,
         back_populates="saved_by_users",
-        lazy="joined"
+        lazy="raise",
+        passive_deletes=True
     )
 
     password_entry = relationship(
         "PasswordModel",
         uselist=False,
         back_populates="user",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        lazy="raise",
+        passive_deletes=True
+    )
+
+    # Sektöre göre kullanıcı eşleşmesi (&& operatörü) için GIN indeks
+    __table_args__ = (
+        Index("ix_users_sectors_gin", "sectors", postgresql_using="gin"),
     )
 
 class PasswordModel(Base):
@@ -58,4 +70,4 @@ class PasswordModel(Base):
     hashed_password = Column(String, nullable=False)
     last_changed = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
-    user = relationship("UserModel", back_populates="password_entry")
\ No newline at end of file
+    user = relationship("UserModel", back_populates="password_entry", lazy="raise")
\ No newline at end of file
@@ -0,0 +1,89 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Tuple, Union
+from uuid import UUID
+
+from fastapi import HTTPException, Query, status
+from sqlalchemy import Select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+# 🔖 İmleç: (sıralama değeri, guid) çiftinin base64 ile kodlanmış hali.
+# İstemci için opaktır; sadece bir sonraki sayfayı istemek için geri gönderilir.
+# Sıralama değeri tarih (ISO metni) ya da sayı (ör. arama skoru) olabilir.
+
+SortValue = Union[datetime, float]
+
+
+def encode_cursor(sort_value: SortValue, guid: UUID) -> str:
+    value = sort_value.isoformat() if isinstance(sort_value, datetime) else float(sort_value)
+    raw = json.dumps([value, str(guid)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[SortValue, UUID]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_value, guid = json.loads(base64.urlsafe_b64decode(padded))
+        if isinstance(sort_value, str):
+            return datetime.fromisoformat(sort_value), UUID(guid)
+        if isinstance(sort_value, bool) or not isinstance(sort_value, (int, float)):
+            raise TypeError(sort_value)
+        return float(sort_value), UUID(guid)
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Geçersiz sayfalama imleci."
+        )
+
+
+class PageParams:
+    def __init__(
+        self,
+        cursor: Optional[str] = Query(None, description="Önceki yanıttaki next_cursor değeri"),
+        limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    ):
+        self.cursor = cursor
+        self.limit = limit
+
+
+CURSOR_COLUMNS = ("cursor_sort", "cursor_guid")
+
+
+async def keyset_paginate(db: AsyncSession, stmt: Select, page: PageParams, sort_column, guid_column, as_mappings: bool = False) -> Tuple[List[Any], Optional[str]]:
+    """
+    (sort_column, guid_column) üzerinde azalan sırada keyset sayfalama yapar.
+    OFFSET kullanılmadığı için derin sayfalar da ilk sayfa kadar ucuzdur;
+    bir sonraki sayfanın olup olmadığı limit + 1 satır çekilerek anlaşılır.
+
+    Sıralama kolonları seçilen varlığa ait olmak zorunda değildir (ör. bir
+    ara tablodaki saved_at); imleç değerleri sorguya ek kolon olarak eklenir.
+
+    as_mappings=True ise sorgu Core kolonları seçer ve her satır imleç
+    kolonları çıkarılmış bir sözlük olarak döner; aksi halde ilk varlık döner.
+    """
+    if page.cursor:
+        sort_value, guid = decode_cursor(page.cursor)
+        stmt = stmt.where(tuple_(sort_column, guid_column) < (sort_value, guid))
+
+    result = await db.execute(
+        stmt
+        .add_columns(sort_column.label("cursor_sort"), guid_column.label("cursor_guid"))
+        .order_by(sort_column.desc(), guid_column.desc())
+        .limit(page.limit + 1)
+    )
+    rows = result.all()
+
+    next_cursor = None
+    if len(rows) > page.limit:
+        rows = rows[:page.limit]
+        next_cursor = encode_cursor(rows[-1].cursor_sort, rows[-1].cursor_guid)
+    if as_mappings:
+        return [
+            {key: value for key, value in row._mapping.items() if key not in CURSOR_COLUMNS}
+            for row in rows
+        ], next_cursor
+    return [row[0] for row in rows], next_cursor
@@ -0,0 +1,124 @@
+import asyncio
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Optional, Tuple
+
+from fastapi import HTTPException, status
+from passlib.context import CryptContext
+
+from dotenv import load_dotenv
+
+from metrics import Counter, Gauge, Histogram
+
+load_dotenv()
+
+# Bu modül ProcessPoolExecutor worker'larında da import edilir; bu yüzden
+# veritabanı veya uygulama modüllerine bağımlılığı yoktur.
+
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", 12))
+PASSWORD_HASH_EXECUTOR = os.getenv("PASSWORD_HASH_EXECUTOR", "thread")  # thread | process
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", 2))
+PASSWORD_HASH_QUEUE_LIMIT = int(os.getenv("PASSWORD_HASH_QUEUE_LIMIT", 32))
+
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=BCRYPT_ROUNDS)
+
+HASH_QUEUE_WAIT = Histogram(
+    "password_hash_queue_wait_seconds", "Şifre işinin executor kuyruğunda beklediği süre"
+)
+HASH_DURATION = Histogram(
+    "password_hash_duration_seconds", "bcrypt hash/verify süresi",
+    buckets=(0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1.0, 2.0, 5.0)
+)
+HASH_REJECTED = Counter(
+    "password_hash_rejected_total", "Kuyruk dolu olduğu için reddedilen şifre işleri"
+)
+
+
+def hash_password(password: str) -> str:
+    return pwd_context.hash(password)
+
+
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    return pwd_context.verify(plain_password, hashed_password)
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Hash eski bir şemayla ya da farklı bir bcrypt maliyetiyle üretilmişse True."""
+    if pwd_context.needs_update(hashed_password):
+        return True
+    try:
+        return int(hashed_password.split("$")[2]) != BCRYPT_ROUNDS
+    except (IndexError, ValueError):
+        return True
+
+
+def _timed(fn: Callable[..., Any], *args: Any) -> Tuple[Any, float, float]:
+    started = time.monotonic()
+    result = fn(*args)
+    return result, started, time.monotonic() - started
+
+
+class PasswordWorkPool:
+    """
+    bcrypt işleri için ayrılmış, boyutu sınırlı executor. Paylaşılan
+    threadpool'u meşgul etmez; kuyruk dolduğunda istek 503 ile reddedilir.
+    """
+
+    def __init__(self, kind: str, workers: int, queue_limit: int):
+        self.kind = kind
+        self.workers = workers
+        self.capacity = workers + queue_limit
+        self.pending = 0
+        self._executor: Optional[Executor] = None
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.kind == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="password-hash"
+                )
+        return self._executor
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        if self.pending >= self.capacity:
+            HASH_REJECTED.inc()
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Sunucu şu anda yoğun. Lütfen birkaç saniye sonra tekrar deneyin.",
+                headers={"Retry-After": "2"},
+            )
+
+        self.pending += 1
+        enqueued = time.monotonic()
+        try:
+            loop = asyncio.get_running_loop()
+            result, started, elapsed = await loop.run_in_executor(
+                self._get_executor(), _timed, fn, *args
+            )
+        finally:
+            self.pending -= 1
+
+        HASH_QUEUE_WAIT.observe(max(0.0, started - enqueued))
+        HASH_DURATION.observe(elapsed)
+        return result
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+password_pool = PasswordWorkPool(PASSWORD_HASH_EXECUTOR, PASSWORD_HASH_WORKERS, PASSWORD_HASH_QUEUE_LIMIT)
+
+Gauge("password_hash_pending", "Çalışan ve kuyrukta bekleyen şifre işleri", lambda: password_pool.pending)
+
+
+async def hash_password_async(password: str) -> str:
+    return await password_pool.run(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await password_pool.run(verify_password, plain_password, hashed_password)
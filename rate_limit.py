@@ -0,0 +1,29 @@
+import os
+
+from dotenv import load_dotenv
+from slowapi import Limiter
+from slowapi.util import get_remote_address
+
+import rate_limit_storage  # noqa: F401  "shm://" şemasını limits'e kaydeder
+
+load_dotenv()
+
+RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true"
+# Tüm uygulama için istemci başına üst sınır (ör. "300/minute"); boşsa uygulanmaz
+RATE_LIMIT_DEFAULT = os.getenv("RATE_LIMIT_DEFAULT", "")
+# Varsayılan olarak aynı makinedeki worker'lar /dev/shm üzerinden sayaç paylaşır;
+# /dev/shm olmayan ortamlarda süreç içi bellek kullanılır
+RATE_LIMIT_STORAGE_URI = os.getenv(
+    "RATE_LIMIT_STORAGE_URI",
+    f"shm://{rate_limit_storage.DEFAULT_PATH}" if os.path.isdir("/dev/shm") else "memory://",
+)
+RATE_LIMIT_STRATEGY = os.getenv("RATE_LIMIT_STRATEGY", "sliding-window-counter")
+
+# 🚦 Uygulama genelinde tek limiter: router dekoratörleri ve middleware aynı
+# depolamayı paylaşır.
+limiter = Limiter(
+    key_func=get_remote_address,
+    enabled=RATE_LIMIT_ENABLED,
+    storage_uri=RATE_LIMIT_STORAGE_URI,
+    strategy=RATE_LIMIT_STRATEGY,
+)
@@ -0,0 +1,249 @@
+import fcntl
+import hashlib
+import mmap
+import os
+import struct
+import threading
+import time
+import urllib.parse
+from contextlib import contextmanager
+from math import floor
+from typing import Iterator, List, Optional, Tuple
+
+from limits.storage import SlidingWindowCounterSupport, Storage
+
+# -------------------------------
+# 🧮 Paylaşımlı bellek rate limit deposu
+# -------------------------------
+# Aynı makinedeki tüm uvicorn worker'ları /dev/shm altındaki tek bir mmap
+# dosyasını paylaşır; limitler worker sayısıyla çarpılmaz ve worker yeniden
+# başlatıldığında sayaçlar sıfırlanmaz.
+#
+# Tablo eşit boyutlu şeritlere (stripe) bölünür. Bir anahtar her zaman aynı
+# şeridin içinde yerleşir, böylece tek bir şerit kilidi yeterlidir:
+#   - süreçler arası: dosya üzerinde şerit başına 1 baytlık fcntl kaydı kilidi
+#   - süreç içi: şerit başına threading.Lock (fcntl kilidi süreç başınadır)
+#
+# Slot düzeni: key_hash, window, expires_at, previous, current
+
+MAGIC = b"RLSHM001"
+HEADER = struct.Struct("<8sII")
+SLOT = struct.Struct("<Qqdqq")
+MAX_PROBE = 16
+
+DEFAULT_PATH = "/dev/shm/announcement-api-ratelimit"
+DEFAULT_SLOTS = 65536
+DEFAULT_STRIPES = 64
+
+
+def _key_hash(key: str) -> int:
+    # Python'un hash()'i süreç başına rastgeledir; worker'lar arasında sabit değil
+    value = int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "little")
+    return value or 1
+
+
+class SharedMemoryStorage(Storage, SlidingWindowCounterSupport):
+    """
+    limits için mmap tabanlı depolama. ``shm:///dev/shm/dosya?slots=65536&stripes=64``
+    biçimindeki URI ile kullanılır; fixed-window (limits 4.x'te elastic
+    expiry dahil) ve sliding-window-counter stratejilerini destekler.
+
+    Tablo doluysa (şeritte boş ya da süresi geçmiş slot yoksa) süresi en yakın
+    slot yeniden kullanılır; bu durumda o anahtarın sayacı erken sıfırlanmış olur.
+    """
+
+    STORAGE_SCHEME = ["shm"]
+
+    def __init__(self, uri: Optional[str] = None, wrap_exceptions: bool = False, **options):
+        super().__init__(uri, wrap_exceptions=wrap_exceptions, **options)
+        parsed = urllib.parse.urlparse(uri or "shm://")
+        query = urllib.parse.parse_qs(parsed.query)
+        self.path = parsed.path or DEFAULT_PATH
+        slots = int(query.get("slots", [options.get("slots", DEFAULT_SLOTS)])[0])
+        stripes = int(query.get("stripes", [options.get("stripes", DEFAULT_STRIPES)])[0])
+        self.stripes = max(1, stripes)
+        self.stripe_size = max(MAX_PROBE, slots // self.stripes)
+        self.slots = self.stripe_size * self.stripes
+        self._open()
+        os.register_at_fork(after_in_child=self._reset_thread_locks)
+
+    # --- dosya ve kilitler ---
+
+    def _open(self) -> None:
+        size = HEADER.size + self.slots * SLOT.size
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        # Başlık kontrolü ve ilk kurulum tüm dosya kilitliyken yapılır
+        fcntl.lockf(self._fd, fcntl.LOCK_EX)
+        try:
+            if os.fstat(self._fd).st_size != size:
+                os.ftruncate(self._fd, 0)
+                os.ftruncate(self._fd, size)
+            self._map = mmap.mmap(self._fd, size)
+            magic, slots, stripes = HEADER.unpack_from(self._map, 0)
+            if magic != MAGIC or slots != self.slots or stripes != self.stripes:
+                self._map[:] = bytes(size)
+                HEADER.pack_into(self._map, 0, MAGIC, self.slots, self.stripes)
+        finally:
+            fcntl.lockf(self._fd, fcntl.LOCK_UN)
+        self._reset_thread_locks()
+
+    def _reset_thread_locks(self) -> None:
+        self._thread_locks: List[threading.Lock] = [threading.Lock() for _ in range(self.stripes)]
+
+    @contextmanager
+    def _stripe(self, stripe: int) -> Iterator[None]:
+        with self._thread_locks[stripe]:
+            # Kilit baytları veri alanının dışındadır; kayıt kilidi dosya boyutundan bağımsızdır
+            fcntl.lockf(self._fd, fcntl.LOCK_EX, 1, len(self._map) + stripe)
+            try:
+                yield
+            finally:
+                fcntl.lockf(self._fd, fcntl.LOCK_UN, 1, len(self._map) + stripe)
+
+    # --- slot yönetimi (şerit kilidi altında çağrılır) ---
+
+    def _locate(self, key: str) -> Tuple[int, int]:
+        key_hash = _key_hash(key)
+        return key_hash, key_hash % self.stripes
+
+    def _offset(self, index: int) -> int:
+        return HEADER.size + index * SLOT.size
+
+    def _find(self, key_hash: int, stripe: int, now: float, create: bool) -> Optional[int]:
+        base = stripe * self.stripe_size
+        start = (key_hash >> 32) % self.stripe_size
+        reusable, oldest, oldest_expiry = None, None, None
+        for probe in range(MAX_PROBE):
+            index = base + (start + probe) % self.stripe_size
+            slot_hash, _, expires_at, _, _ = SLOT.unpack_from(self._map, self._offset(index))
+            if slot_hash == key_hash:
+                return index
+            if slot_hash == 0 or expires_at <= now:
+                if reusable is None:
+                    reusable = index
+            elif oldest_expiry is None or expires_at < oldest_expiry:
+                oldest, oldest_expiry = index, expires_at
+        if not create:
+            return None
+        index = reusable if reusable is not None else oldest
+        SLOT.pack_into(self._map, self._offset(index), key_hash, 0, 0.0, 0, 0)
+        return index
+
+    def _read(self, index: int):
+        return SLOT.unpack_from(self._map, self._offset(index))
+
+    def _write(self, index: int, key_hash: int, window: int, expires_at: float, previous: int, current: int) -> None:
+        SLOT.pack_into(self._map, self._offset(index), key_hash, window, expires_at, previous, current)
+
+    # --- Storage ---
+
+    @property
+    def base_exceptions(self):
+        return (OSError, ValueError)
+
+    def incr(self, key: str, expiry: int, elastic_expiry: bool = False, amount: int = 1) -> int:
+        # limits 4.x elastic_expiry'yi konumsal da gönderebilir; 5.x hiç göndermez
+        key_hash, stripe = self._locate(key)
+        now = time.time()
+        with self._stripe(stripe):
+            index = self._find(key_hash, stripe, now, create=True)
+            _, _, expires_at, _, current = self._read(index)
+            if expires_at <= now:
+                current, expires_at = 0, now + expiry
+            elif elastic_expiry:
+                expires_at = now + expiry
+            current += amount
+            self._write(index, key_hash, 0, expires_at, 0, current)
+            return current
+
+    def get(self, key: str) -> int:
+        key_hash, stripe = self._locate(key)
+        now = time.time()
+        with self._stripe(stripe):
+            index = self._find(key_hash, stripe, now, create=False)
+            if index is None:
+                return 0
+            _, _, expires_at, _, current = self._read(index)
+            return current if expires_at > now else 0
+
+    def get_expiry(self, key: str) -> float:
+        key_hash, stripe = self._locate(key)
+        now = time.time()
+        with self._stripe(stripe):
+            index = self._find(key_hash, stripe, now, create=False)
+            if index is None:
+                return now
+            expires_at = self._read(index)[2]
+            return expires_at if expires_at > now else now
+
+    def check(self) -> bool:
+        return not self._map.closed
+
+    def reset(self) -> Optional[int]:
+        now = time.time()
+        cleared = 0
+        for stripe in range(self.stripes):
+            with self._stripe(stripe):
+                base = stripe * self.stripe_size
+                for index in range(base, base + self.stripe_size):
+                    slot_hash, _, expires_at, _, _ = self._read(index)
+                    if slot_hash:
+                        cleared += expires_at > now
+                        self._write(index, 0, 0, 0.0, 0, 0)
+        return cleared
+
+    def clear(self, key: str) -> None:
+        key_hash, stripe = self._locate(key)
+        with self._stripe(stripe):
+            index = self._find(key_hash, stripe, time.time(), create=False)
+            if index is not None:
+                self._write(index, 0, 0, 0.0, 0, 0)
+
+    # --- SlidingWindowCounterSupport ---
+    # Önceki ve mevcut pencere sayaçları tek slotta tutulur; pencere ilerledikçe
+    # slot yerinde kaydırılır, böylece bir istek tek şerit kilidiyle sonuçlanır.
+
+    def _roll(self, index: int, expiry: int, now: float) -> Tuple[int, int, int]:
+        _, window, _, previous, current = self._read(index)
+        now_window = int(now // expiry)
+        if window == now_window:
+            return now_window, previous, current
+        if window == now_window - 1:
+            return now_window, current, 0
+        return now_window, 0, 0
+
+    @staticmethod
+    def _window_info(expiry: int, now: float, previous: int, current: int) -> Tuple[int, float, int, float]:
+        previous_ttl = (1 - ((now / expiry) % 1)) * expiry if previous else 0.0
+        current_ttl = (1 - ((now / expiry) % 1)) * expiry + expiry
+        return previous, previous_ttl, current, current_ttl
+
+    def acquire_sliding_window_entry(self, key: str, limit: int, expiry: int, amount: int = 1) -> bool:
+        if amount > limit:
+            return False
+        key_hash, stripe = self._locate(key)
+        now = time.time()
+        with self._stripe(stripe):
+            index = self._find(key_hash, stripe, now, create=True)
+            window, previous, current = self._roll(index, expiry, now)
+            previous_ttl = self._window_info(expiry, now, previous, current)[1]
+            if floor(previous * previous_ttl / expiry + current) + amount > limit:
+                allowed = False
+            else:
+                current += amount
+                allowed = True
+            self._write(index, key_hash, window, (window + 2) * expiry, previous, current)
+            return allowed
+
+    def get_sliding_window(self, key: str, expiry: int) -> Tuple[int, float, int, float]:
+        key_hash, stripe = self._locate(key)
+        now = time.time()
+        with self._stripe(stripe):
+            index = self._find(key_hash, stripe, now, create=False)
+            if index is None:
+                return self._window_info(expiry, now, 0, 0)
+            _, previous, current = self._roll(index, expiry, now)
+        return self._window_info(expiry, now, previous, current)
+
+    def clear_sliding_window(self, key: str, expiry: int) -> None:
+        self.clear(key)
@@ -1,7 +1,7 @@
 from typing import List, Optional, Literal
 from datetime import datetime
 from uuid import UUID
-from pydantic import BaseModel, EmailStr, field_validator, ValidationInfo, ConfigDict, constr
+from pydantic import BaseModel, EmailStr, Field, field_validator, ValidationInfo, ConfigDict, constr
 from enum import Enum
 import re
 
@@ -26,6 +26,9 @@ class RoleEnum(str, Enum):
 # 🔐 Token şemaları
 class TokenData(BaseModel):
     sub: str
+    role: RoleEnum
+    sectors: List[str] = []
+    ver: int
     model_config = ConfigDict(from_attributes=True)
 
 class TokenResponse(BaseModel):
@@ -173,6 +176,33 @@ class AnnouncementUpdateRequest(AnnouncementCreateRequest):
     sectors: Optional[List[str]] = None
     model_config = ConfigDict(from_attributes=False)
 
+# 🔖 Toplu kaydetme / kaldırma
+MAX_BULK_GUIDS = 500
+
+class AnnouncementBulkRequest(BaseModel):
+    guids: List[UUID] = Field(..., min_length=1, max_length=MAX_BULK_GUIDS)
+    model_config = ConfigDict(from_attributes=False)
+
+class AnnouncementBulkResult(BaseModel):
+    processed: List[UUID]
+    skipped: List[UUID]
+    model_config = ConfigDict(from_attributes=True)
+
+# 📥 Toplu içe aktarım raporu
+class AnnouncementImportError(BaseModel):
+    row: int
+    errors: List[str]
+    model_config = ConfigDict(from_attributes=True)
+
+class AnnouncementImportResult(BaseModel):
+    inserted: int
+    failed: int
+    errors: List[AnnouncementImportError]
+    errors_truncated: bool = False
+    # Gövde yarıda kesildiyse nedeni; inserted o ana kadar commit edilen satırlardır
+    aborted: Optional[str] = None
+    model_config = ConfigDict(from_attributes=True)
+
 # 📄 Duyuru çıktıları
 class AnnouncementSummary(BaseModel):
     guid: UUID
@@ -196,6 +226,11 @@ class AnnouncementResponse(BaseModel):
     created_at: datetime
     model_config = ConfigDict(from_attributes=True)
 
+class AnnouncementPage(BaseModel):
+    items: List[AnnouncementResponse]
+    next_cursor: Optional[str] = None
+    model_config = ConfigDict(from_attributes=True)
+
 # 👤 Kullanıcı çıktısı
 class UserResponse(BaseModel):
     id: int
@@ -28,5 +28,5 @@ SECTOR_LIST: List[SectorItem] = [
 ]
 
 @router.get("/", response_model=List[SectorItem])
-def get_sectors() -> List[SectorItem]:
+async def get_sectors() -> List[SectorItem]:
     return SECTOR_LIST
\ No newline at end of file
@@ -1,23 +1,10 @@
 from datetime import datetime, timedelta, timezone
 from typing import Optional, List, Any
 
-from fastapi import Depends, HTTPException, status
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from jose import JWTError, jwt
-from passlib.context import CryptContext
-from sqlalchemy.orm import Session
+from jose import jwt
 
-from database import get_db
-from models.user_model import UserModel, RoleEnum
-
-
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
-def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
-
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+from models.user_model import UserModel
+from passwords import hash_password, verify_password, hash_password_async, verify_password_async
 
 
 SECRET_KEY = "your-secret-key"  
@@ -26,60 +13,18 @@ ACCESS_TOKEN_EXPIRE_MINUTES = 60
 
 def create_access_token(user: UserModel, expires_delta: Optional[timedelta] = None) -> str:
     expire = datetime.now(timezone.utc) + (expires_delta or timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES))
+    # Rol, sektörler ve token sürümü imzalı claim olarak taşınır; böylece
+    # kimlik doğrulama her istekte kullanıcı satırını okumak zorunda kalmaz.
     payload = {
         "sub": str(user.id),
         "role": user.role.value,
+        "sectors": list(user.sectors or []),
+        "ver": user.token_version or 0,
         "exp": expire,
     }
     return jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM)
 
 
-bearer_scheme = HTTPBearer(auto_error=False)
-
-def get_current_user(
-    credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme),
-    db: Session = Depends(get_db)
-) -> UserModel:
-    if not credentials or credentials.scheme.lower() != "bearer":
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Authorization header eksik veya 'Bearer <token>' formatında değil."
-        )
-
-    token = credentials.credentials
-
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        user_id = int(payload.get("sub"))
-        if not user_id:
-            raise ValueError("sub alanı boş")
-    except (JWTError, ValueError):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Token doğrulanamadı veya geçersiz payload."
-        )
-
-    user = db.query(UserModel).filter(UserModel.id == user_id).first()
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Kullanıcı bulunamadı."
-        )
-
-    return user
-
-
-def get_current_admin_user(
-    current_user: UserModel = Depends(get_current_user)
-) -> UserModel:
-    if current_user.role != RoleEnum.ADMIN:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Bu işlem için admin yetkisi gerekli."
-        )
-    return current_user
-
-
 def normalize_and_update_user_fields(
     data: Any,
     target: UserModel,
@@ -0,0 +1,76 @@
+from typing import Any, Iterable, List, Literal, Mapping, Optional
+
+from fastapi import HTTPException, Query, status
+from pydantic_core import to_json
+
+from models.announcement_model import AnnouncementModel
+from schemas import AnnouncementResponse, AnnouncementSummary
+
+try:
+    import orjson
+except ImportError:  # orjson opsiyoneldir; yoksa pydantic-core kullanılır
+    orjson = None
+
+# -------------------------------
+# ⚡ Hızlı liste serileştirme
+# -------------------------------
+# Liste endpoint'leri ORM nesnesi yerine sadece AnnouncementResponse
+# kolonlarını Core satırı olarak seçer ve bunları doğrudan JSON baytına çevirir.
+# Satırlar veritabanı şemasından geldiği için yanıt modeline karşı tekrar
+# doğrulanmaz; response_model sadece OpenAPI dokümantasyonu için kalır.
+
+ANNOUNCEMENT_COLUMNS = [getattr(AnnouncementModel, name) for name in AnnouncementResponse.model_fields]
+ANNOUNCEMENT_FIELDS = tuple(AnnouncementResponse.model_fields)
+SUMMARY_FIELDS = tuple(AnnouncementSummary.model_fields)
+
+
+class FieldParams:
+    """
+    Liste yanıtlarında seçilecek alanlar: ``view=summary`` AnnouncementSummary
+    alanlarını, ``fields=title,sectors`` ise istenen alanları seçer. Seçim hem
+    SQL SELECT kolonlarını hem de yanıt gövdesini daraltır; guid her zaman döner.
+    """
+
+    def __init__(
+        self,
+        view: Literal["full", "summary"] = Query("full", description="full: tüm alanlar, summary: guid, başlık ve son başvuru"),
+        fields: Optional[str] = Query(None, max_length=300, description="Virgülle ayrılmış alan listesi (view'i geçersiz kılar)"),
+    ):
+        if fields:
+            requested = [name.strip() for name in fields.split(",") if name.strip()]
+            unknown = [name for name in requested if name not in ANNOUNCEMENT_FIELDS]
+            if unknown:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Geçersiz alan: {', '.join(unknown)}"
+                )
+            # Sıra ve tekrarlar cache anahtarını bölmesin diye şema sırasına göre normalize edilir
+            names = {"guid", *requested}
+            self.names = tuple(name for name in ANNOUNCEMENT_FIELDS if name in names)
+        elif view == "summary":
+            self.names = SUMMARY_FIELDS
+        else:
+            self.names = ANNOUNCEMENT_FIELDS
+
+    @property
+    def columns(self) -> List[Any]:
+        return [getattr(AnnouncementModel, name) for name in self.names]
+
+    @property
+    def key(self) -> str:
+        if self.names == ANNOUNCEMENT_FIELDS:
+            return "full"
+        if self.names == SUMMARY_FIELDS:
+            return "summary"
+        return ",".join(self.names)
+
+
+def dumps(value: Any) -> bytes:
+    if orjson is not None:
+        # UTC zaman damgaları pydantic çıktısıyla aynı biçimde ("Z") yazılır
+        return orjson.dumps(value, option=orjson.OPT_UTC_Z)
+    return to_json(value)
+
+
+def page_json(items: Iterable[Mapping[str, Any]], next_cursor: Optional[str]) -> bytes:
+    return dumps({"items": [dict(item) for item in items], "next_cursor": next_cursor})
@@ -0,0 +1,138 @@
+import logging
+import os
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+from dotenv import load_dotenv
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+load_dotenv()
+
+logger = logging.getLogger("sql")
+
+# -------------------------------
+# 🔎 İstek bazlı SQL ölçümü
+# -------------------------------
+# Engine olayları her sorguyu, o anki isteğin ContextVar'daki istatistiğine
+# yazar. AsyncSession'ın greenlet'leri çağıranın context'ini taşıdığı için
+# async engine'de de aynı istek nesnesi görülür.
+
+SQL_SLOW_QUERY_MS = float(os.getenv("SQL_SLOW_QUERY_MS", 200))
+# Aynı SQL metni tek istekte bu sayıya ulaşırsa N+1 olarak işaretlenir
+SQL_N_PLUS_ONE_THRESHOLD = int(os.getenv("SQL_N_PLUS_ONE_THRESHOLD", 5))
+# Testlerde açılır: route bütçesi aşıldığında istek hata ile sonuçlanır
+SQL_STRICT_BUDGET = os.getenv("SQL_STRICT_BUDGET", "false").lower() == "true"
+SERVER_TIMING_ENABLED = os.getenv(
+    "SERVER_TIMING_ENABLED", str(os.getenv("ENV", "development") != "production")
+).lower() == "true"
+
+MAX_LOGGED_PARAMS = 500
+
+_WHITESPACE = re.compile(r"\s+")
+# IN (...) listeleri eleman sayısından bağımsız tek bir metne indirgenir
+_PARAM_LIST = re.compile(r"\(\s*(?:\$\d+|%\(\w+\)s|\?)(?:::\w+)?(?:\s*,\s*(?:\$\d+|%\(\w+\)s|\?)(?:::\w+)?)+\s*\)")
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+class QueryStats:
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.statements: Counter = Counter()
+        self.budget: Optional[int] = None
+
+    def record(self, statement: str, elapsed: float) -> None:
+        self.count += 1
+        self.duration += elapsed
+        self.statements[statement] += 1
+        if SQL_STRICT_BUDGET and self.budget is not None and self.count > self.budget:
+            raise QueryBudgetExceeded(f"Sorgu bütçesi aşıldı: {self.count} > {self.budget}")
+
+    def repeated(self):
+        return [(sql, n) for sql, n in self.statements.items() if n >= SQL_N_PLUS_ONE_THRESHOLD]
+
+    def server_timing(self) -> str:
+        return f'db;dur={self.duration * 1000:.1f};desc="{self.count} sorgu"'
+
+
+_current: ContextVar[Optional[QueryStats]] = ContextVar("sql_query_stats", default=None)
+
+
+def normalize_sql(statement: str) -> str:
+    return _PARAM_LIST.sub("(...)", _WHITESPACE.sub(" ", statement).strip())
+
+
+def current_stats() -> Optional[QueryStats]:
+    return _current.get()
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Bir istek ya da test bloğu boyunca çalışan sorguları sayar."""
+    stats = QueryStats()
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+def report(stats: QueryStats, method: str, path: str) -> None:
+    """İstek sonunda N+1 şüphelerini ve gevşek modda bütçe aşımını loglar."""
+    for statement, count in stats.repeated():
+        logger.warning(f"⚠️ Olası N+1: {method} {path} aynı sorguyu {count} kez çalıştırdı: {statement}")
+    if stats.budget is not None and stats.count > stats.budget:
+        logger.warning(f"⚠️ Sorgu bütçesi aşıldı: {method} {path} {stats.count} sorgu (bütçe {stats.budget})")
+
+
+def query_budget(max_queries: int):
+    """
+    Route bağımlılığı: isteğin çalıştırabileceği en fazla sorgu sayısı.
+    SQL_STRICT_BUDGET açıkken aşım isteği hata ile bitirir, aksi halde loglanır.
+    """
+    async def set_budget() -> None:
+        stats = current_stats()
+        if stats is not None:
+            stats.budget = max_queries
+    return set_budget
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_started"].pop()
+    normalized = normalize_sql(statement)
+    if elapsed * 1000 >= SQL_SLOW_QUERY_MS:
+        params = repr(parameters)
+        if len(params) > MAX_LOGGED_PARAMS:
+            params = params[:MAX_LOGGED_PARAMS] + "…"
+        logger.warning(f"🐢 Yavaş sorgu ({elapsed * 1000:.1f} ms): {normalized} | parametreler: {params}")
+
+    stats = _current.get()
+    if stats is not None:
+        stats.record(normalized, elapsed)
+
+
+def _handle_error(exception_context):
+    started = exception_context.connection.info.get("query_started") if exception_context.connection else None
+    if started:
+        started.pop()
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Senkron engine'e ya da AsyncEngine.sync_engine'e olay dinleyicilerini ekler."""
+    if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
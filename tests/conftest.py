@@ -0,0 +1,12 @@
+import os
+
+import pytest
+
+# Uygulama modülleri import edilmeden önce: limit sayaçları ve Server-Timing
+os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
+os.environ.setdefault("SERVER_TIMING_ENABLED", "true")
+
+
+@pytest.fixture(scope="session")
+def anyio_backend():
+    return "asyncio"
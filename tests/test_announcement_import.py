@@ -0,0 +1,49 @@
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("sqlalchemy")
+
+from starlette.requests import ClientDisconnect
+
+import announcement_import
+from announcement_import import import_announcements
+from middlewares.pipeline import RequestBodyTooLarge
+
+pytestmark = pytest.mark.anyio
+
+ROW = b'{"title": "x"}\n'
+DEADLINE = datetime(2030, 1, 1, tzinfo=timezone.utc)
+
+
+def _stream(chunks, error):
+    async def stream():
+        for chunk in chunks:
+            yield chunk
+        raise error
+    return stream()
+
+
+@pytest.mark.parametrize(("error", "reason"), [
+    (RequestBodyTooLarge(), "İstek boyutu çok büyük."),
+    (ClientDisconnect(), "İstemci bağlantısı koptu."),
+])
+async def test_interrupted_stream_returns_partial_report(monkeypatch, error, reason):
+    written = []
+
+    async def insert_batch(items):
+        written.append(len(items))
+
+    monkeypatch.setattr(announcement_import, "IMPORT_BATCH_SIZE", 2)
+    monkeypatch.setattr(announcement_import, "insert_batch", insert_batch)
+    monkeypatch.setattr(announcement_import, "validate_batch", lambda batch: ([SimpleNamespace(application_deadline=DEADLINE)] * len(batch), {}))
+
+    result, deadlines = await import_announcements(_stream([ROW * 3], error), "ndjson")
+
+    # İlk parti commit edilmiştir; kesilmeden önce okunan yarım parti yazılmaz
+    assert written == [2]
+    assert result.inserted == 2
+    assert deadlines == [DEADLINE, DEADLINE]
+    assert result.aborted == reason
@@ -0,0 +1,33 @@
+import pytest
+
+pytest.importorskip("dotenv")
+
+from cache import MemoryCacheBackend, ResponseCache
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_response_entries_do_not_evict_scope_versions():
+    cache = ResponseCache(MemoryCacheBackend(max_entries=2), versions=MemoryCacheBackend())
+    version = await cache.version("announcements:all")
+
+    for index in range(10):
+        key = await cache.key("announcements:search", str(index))
+        await cache.get_or_load(key, lambda: _body(index))
+
+    assert await cache.version("announcements:all") == version
+
+
+async def test_invalidate_advances_only_the_given_scope():
+    cache = ResponseCache(MemoryCacheBackend(), versions=MemoryCacheBackend())
+    search = await cache.version("announcements:search")
+    active = await cache.version("announcements:active")
+
+    await cache.invalidate("announcements:search")
+
+    assert await cache.version("announcements:search") > search
+    assert await cache.version("announcements:active") == active
+
+
+async def _body(index: int) -> bytes:
+    return str(index).encode()
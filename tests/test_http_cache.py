@@ -0,0 +1,38 @@
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("dotenv")
+
+from starlette.requests import Request
+
+from http_cache import make_etag, not_modified_etag, public_cache_headers, variant_etag
+
+ETAG = make_etag("announcements:all", "1", "page")
+
+
+def _request(**headers: str) -> Request:
+    raw = [(name.replace("_", "-").encode(), value.encode()) for name, value in headers.items()]
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": raw})
+
+
+@pytest.mark.parametrize("encoding", ["gzip", "br"])
+def test_304_echoes_the_encoding_variant_the_client_sent(encoding):
+    sent = variant_etag(ETAG, encoding)
+    assert not_modified_etag(_request(if_none_match=sent), ETAG) == sent
+
+
+def test_base_etag_and_wildcard_match():
+    assert not_modified_etag(_request(if_none_match=f'"other", {ETAG}'), ETAG) == ETAG
+    assert not_modified_etag(_request(if_none_match="*"), ETAG) == ETAG
+    assert not_modified_etag(_request(if_none_match='"other"'), ETAG) is None
+
+
+def test_if_modified_since_needs_a_shared_version():
+    request = _request(if_modified_since="Wed, 01 Jan 2031 00:00:00 GMT")
+    assert not_modified_etag(request, ETAG, version_ns=1_000_000_000) == ETAG
+    assert not_modified_etag(request, ETAG) is None
+
+
+def test_last_modified_is_omitted_without_a_version():
+    assert "Last-Modified" not in public_cache_headers(ETAG, None, ["announcements"])
+    assert "Last-Modified" in public_cache_headers(ETAG, 1_000_000_000, ["announcements"])
@@ -0,0 +1,128 @@
+import re
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("asyncpg")
+httpx = pytest.importorskip("httpx")
+
+from sqlalchemy import delete, insert
+from sqlalchemy.exc import DBAPIError
+
+import cache
+import dependencies
+import sql_instrumentation
+from database import AsyncSessionLocal
+from feed import fan_out
+from main import app
+from models.announcement_model import AnnouncementModel, saved_announcements
+from models.user_model import RoleEnum, UserModel
+from security import create_access_token
+from sector_router import SECTOR_LIST
+
+pytestmark = pytest.mark.anyio
+
+# -------------------------------
+# 🔎 Liste uçlarının sorgu bütçeleri
+# -------------------------------
+# Her uç soğuk cache ile bir kez çağrılır; Server-Timing başlığındaki sorgu
+# sayısı route'un query_budget değerine eşit olmalı, sayfa da tam limit kadar
+# satır dönmelidir. SQL_STRICT_BUDGET açık olduğu için aşım 500 ile sonuçlanır.
+
+PAGE_LIMIT = 2
+SEEDED_PER_STATE = PAGE_LIMIT + 1
+SEARCH_WORD = "Sorgubütçesi"
+SECTOR = SECTOR_LIST[0].name
+
+SERVER_TIMING_QUERIES = re.compile(r'db;dur=[\d.]+;desc="(\d+) sorgu"')
+
+# (path, kimlik gerekir mi, beklenen sorgu sayısı)
+LIST_ENDPOINTS = [
+    ("/announcements/all", False, 1),
+    ("/announcements/active", False, 1),
+    ("/announcements/passive", False, 1),
+    (f"/announcements/search?q={SEARCH_WORD}", False, 1),
+    # Token sürümü soğuk cache'te bir kez okunur
+    ("/announcements/by-sector", True, 2),
+    ("/announcements/saved", True, 2),
+]
+
+
+@pytest.fixture(scope="module")
+async def seeded_user():
+    """Her durumdan sayfayı dolduracak kadar duyuru ve bunları kaydetmiş bir kullanıcı."""
+    now = datetime.now(timezone.utc)
+    guids = []
+    rows = []
+    for index in range(SEEDED_PER_STATE * 2):
+        active = index < SEEDED_PER_STATE
+        guid = uuid.uuid4()
+        guids.append(guid)
+        rows.append(dict(
+            guid=guid,
+            title=f"{SEARCH_WORD} testi {index}",
+            description="Sorgu bütçesi testleri için oluşturuldu.",
+            announcement_date=now - timedelta(days=1),
+            application_deadline=now + timedelta(days=30 if active else -1),
+            eligible_institution=["KOBİ"],
+            sectors=[SECTOR],
+            is_active=active,
+        ))
+
+    try:
+        async with AsyncSessionLocal() as db:
+            user = UserModel(
+                email=f"query-budget-{uuid.uuid4().hex[:12]}@example.com",
+                full_name="Sorgu Bütçesi",
+                role=RoleEnum.USER,
+                sectors=[SECTOR],
+            )
+            db.add(user)
+            await db.flush()
+            await db.execute(insert(AnnouncementModel.__table__), rows)
+            await db.execute(
+                insert(saved_announcements),
+                [{"user_id": user.id, "announcement_guid": guid} for guid in guids]
+            )
+            await fan_out(db, guids)
+            await db.commit()
+    except (OSError, DBAPIError) as exc:
+        pytest.skip(f"Test veritabanına bağlanılamadı: {exc}")
+
+    yield user
+
+    async with AsyncSessionLocal() as db:
+        await db.execute(delete(UserModel).where(UserModel.id == user.id))
+        await db.execute(delete(AnnouncementModel).where(AnnouncementModel.guid.in_(guids)))
+        await db.commit()
+
+
+@pytest.fixture
+def cold_caches(monkeypatch):
+    monkeypatch.setattr(cache.response_cache, "backend", cache.MemoryCacheBackend())
+    monkeypatch.setattr(dependencies, "auth_state_cache", cache.MemoryCacheBackend())
+
+
+@pytest.fixture
+def strict_budget(monkeypatch):
+    monkeypatch.setattr(sql_instrumentation, "SQL_STRICT_BUDGET", True)
+
+
+@pytest.mark.parametrize(("path", "auth", "expected_queries"), LIST_ENDPOINTS)
+async def test_list_endpoint_query_and_row_counts(seeded_user, cold_caches, strict_budget, path, auth, expected_queries):
+    headers = {"Authorization": f"Bearer {create_access_token(seeded_user)}"} if auth else {}
+    separator = "&" if "?" in path else "?"
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get(f"{path}{separator}limit={PAGE_LIMIT}", headers=headers)
+
+    assert response.status_code == 200, response.text
+    match = SERVER_TIMING_QUERIES.search(response.headers["server-timing"])
+    assert match is not None
+    assert int(match.group(1)) == expected_queries
+
+    page = response.json()
+    assert len(page["items"]) == PAGE_LIMIT
+    assert page["next_cursor"] is not None
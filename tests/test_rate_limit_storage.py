@@ -0,0 +1,52 @@
+import pytest
+
+pytest.importorskip("limits")
+
+from limits import parse
+from limits.storage import storage_from_string
+from limits.strategies import STRATEGIES
+
+import rate_limit_storage  # noqa: F401  "shm://" şemasını kaydeder
+
+# moving-window ayrı bir depolama arayüzü ister; shm:// bunu sunmaz
+SUPPORTED_STRATEGIES = sorted(name for name in STRATEGIES if name != "moving-window")
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return storage_from_string(f"shm://{tmp_path / 'ratelimit'}?slots=256&stripes=4")
+
+
+@pytest.mark.parametrize("strategy", SUPPORTED_STRATEGIES)
+def test_strategy_enforces_limit_on_shared_memory(storage, strategy):
+    limiter = STRATEGIES[strategy](storage)
+    limit = parse("3/minute")
+
+    assert all(limiter.hit(limit, "client", "route") for _ in range(3))
+    assert not limiter.hit(limit, "client", "route")
+    assert not limiter.test(limit, "client", "route")
+    assert limiter.get_window_stats(limit, "client", "route")[1] == 0
+
+    # Farklı anahtarlar birbirinin sayacını etkilemez
+    assert limiter.hit(limit, "other-client", "route")
+
+
+def test_counters_are_shared_between_storage_instances(tmp_path):
+    uri = f"shm://{tmp_path / 'ratelimit'}?slots=256&stripes=4"
+    first, second = storage_from_string(uri), storage_from_string(uri)
+
+    first.incr("key", 60)
+    second.incr("key", 60, amount=2)
+
+    assert first.get("key") == second.get("key") == 3
+
+
+def test_elastic_expiry_extends_the_window(storage, monkeypatch):
+    now = 1_000_000.0
+    monkeypatch.setattr(rate_limit_storage.time, "time", lambda: now)
+    storage.incr("key", 60)
+
+    now += 30
+    storage.incr("key", 60, elastic_expiry=True)
+
+    assert storage.get_expiry("key") == now + 60
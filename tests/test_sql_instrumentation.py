@@ -0,0 +1,38 @@
+import pytest
+
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("dotenv")
+
+import sql_instrumentation
+from sql_instrumentation import QueryBudgetExceeded, normalize_sql, query_budget, track_queries
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_budget_overrun_raises_in_strict_mode(monkeypatch):
+    monkeypatch.setattr(sql_instrumentation, "SQL_STRICT_BUDGET", True)
+    with track_queries() as stats:
+        await query_budget(1)()
+        stats.record("SELECT 1", 0.0)
+        with pytest.raises(QueryBudgetExceeded):
+            stats.record("SELECT 1", 0.0)
+    assert stats.count == 2
+
+
+async def test_budget_overrun_is_only_counted_in_loose_mode(monkeypatch):
+    monkeypatch.setattr(sql_instrumentation, "SQL_STRICT_BUDGET", False)
+    with track_queries() as stats:
+        await query_budget(1)()
+        stats.record("SELECT 1", 0.0)
+        stats.record("SELECT 1", 0.0)
+    assert (stats.count, stats.budget) == (2, 1)
+
+
+async def test_query_budget_outside_a_request_is_a_no_op():
+    await query_budget(1)()
+    assert sql_instrumentation.current_stats() is None
+
+
+def test_normalize_sql_collapses_in_lists():
+    assert normalize_sql("SELECT *\n  FROM t WHERE id IN ($1, $2, $3)") == "SELECT * FROM t WHERE id IN (...)"
+    assert normalize_sql("SELECT * FROM t WHERE id IN ($1::UUID, $2::UUID)") == "SELECT * FROM t WHERE id IN (...)"
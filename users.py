@@ -1,32 +1,54 @@
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from database import get_db
-from models.user_model import UserModel
+from models.user_model import UserModel, PasswordModel
 from schemas import (
     UserResponse,
     ProfileCompleteRequest,
     ProfileUpdateRequest,
     PasswordChangeRequest
 )
-from dependencies import get_current_user
-from security import verify_password, hash_password
+from dependencies import get_current_user, load_current_user, revoke_user_tokens
+from feed import refresh_user
+from models.loaders import USER_PROFILE
+from security import verify_password_async, hash_password_async, create_access_token
 
 router = APIRouter(prefix="/users", tags=["Users"])
 
+# Sektörler token claim'i olarak taşındığı için değiştiklerinde eski token'lar
+# iptal edilir ve yenisi bu header ile döner.
+ACCESS_TOKEN_HEADER = "X-Access-Token"
+
+# UserResponse döndüren uçlar kaydedilen duyuruların özetini de yükler
+get_user_profile = load_current_user(*USER_PROFILE)
+
+
+async def _commit_profile(db: AsyncSession, user: UserModel, response: Response, old_sectors: List[str]) -> None:
+    if list(user.sectors or []) != list(old_sectors or []):
+        # Feed yeni sektörlere göre aynı transaction içinde yeniden kurulur
+        await refresh_user(db, user.id, list(user.sectors or []))
+        await revoke_user_tokens(db, user)
+        response.headers[ACCESS_TOKEN_HEADER] = create_access_token(user)
+    else:
+        await db.commit()
+
 
 @router.get("/me", response_model=UserResponse)
-def get_me(current_user: UserModel = Depends(get_current_user)):
+async def get_me(current_user: UserModel = Depends(get_user_profile)):
     return current_user
 
 
 @router.post("/profile/complete", response_model=UserResponse)
-def complete_profile(
+async def complete_profile(
     data: ProfileCompleteRequest,
-    db: Session = Depends(get_db),
-    current_user: UserModel = Depends(get_current_user)
+    response: Response,
+    db: AsyncSession = Depends(get_db),
+    current_user: UserModel = Depends(get_user_profile)
 ):
+    old_sectors = current_user.sectors
     current_user.full_name   = data.full_name
     current_user.sectors     = data.sectors
     current_user.phone       = data.phone
@@ -34,17 +56,18 @@ def complete_profile(
     current_user.institution = data.institution
     current_user.profession  = data.profession
 
-    db.commit()
-    db.refresh(current_user)
+    await _commit_profile(db, current_user, response, old_sectors)
     return current_user
 
 
 @router.patch("/profile/update", response_model=UserResponse)
-def update_profile(
+async def update_profile(
     data: ProfileUpdateRequest,
-    db: Session = Depends(get_db),
-    current_user: UserModel = Depends(get_current_user)
+    response: Response,
+    db: AsyncSession = Depends(get_db),
+    current_user: UserModel = Depends(get_user_profile)
 ):
+    old_sectors = current_user.sectors
     for field in [
         "full_name", "sectors", "phone",
         "linkedin", "institution", "profession"
@@ -53,28 +76,37 @@ def update_profile(
         if value is not None:
             setattr(current_user, field, value)
 
-    db.commit()
-    db.refresh(current_user)
+    await _commit_profile(db, current_user, response, old_sectors)
     return current_user
 
 
 @router.patch("/change-password", status_code=status.HTTP_200_OK)
-def change_password(
+async def change_password(
     data: PasswordChangeRequest,
-    db: Session = Depends(get_db),
+    response: Response,
+    db: AsyncSession = Depends(get_db),
     current_user: UserModel = Depends(get_current_user)
 ):
-    if not verify_password(data.old_password, current_user.hashed_password):
+    result = await db.execute(
+        select(PasswordModel).where(PasswordModel.user_id == current_user.id)
+    )
+    password_entry = result.scalar_one_or_none()
+
+    if not password_entry or not await verify_password_async(
+        data.old_password, password_entry.hashed_password
+    ):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Eski şifre yanlış."
         )
 
-    current_user.hashed_password = hash_password(data.new_password)
-    db.commit()
+    password_entry.hashed_password = await hash_password_async(data.new_password)
+    await revoke_user_tokens(db, current_user)
+    response.headers[ACCESS_TOKEN_HEADER] = create_access_token(current_user)
     return {"message": "Şifre başarıyla değiştirildi"}
 
 
 @router.get("/", response_model=List[UserResponse], include_in_schema=False)
-def list_users(db: Session = Depends(get_db)):
-    return db.query(UserModel).all()
\ No newline at end of file
+async def list_users(db: AsyncSession = Depends(get_db)):
+    result = await db.execute(select(UserModel).options(*USER_PROFILE))
+    return result.scalars().all()
\ No newline at end of file